@@ -32,6 +32,11 @@ class Application:
         if self.base_path not in sys.path:
             sys.path.insert(0, self.base_path)
 
+        # Validate configuration before starting (skipped in workers once the master validated).
+        # Runs last: the project's config modules are only importable once base_path is on sys.path
+        from larasanic.validation.validate_app import ValidateApp
+        ValidateApp.validate_startup_app()
+
     def singleton(self, key: str, factory_or_instance):
         """
         Register a singleton binding (Laravel-style container)
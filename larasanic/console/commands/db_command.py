@@ -37,6 +37,7 @@ class DbManagerCommand(Command):
                 # Database might not be needed for all commands
                 pass
         from larasanic.validation import ValidateApp
+        ValidateApp.validate_startup_app()
 
     async def _handleClose(self):
         """
@@ -128,7 +128,7 @@ class MigrationManager:
             await command.upgrade(run_in_transaction=True)
             logger.info("✓ Migrations completed successfully")
         except Exception as e:
-            logger.error(f"Migration failed: {e}")
+            logger.error("Migration failed: %s", e)
             raise
 
     async def rollback(self, version: int = -1):
@@ -142,7 +142,7 @@ class MigrationManager:
         """
         from aerich import Command
 
-        logger.info(f"Rolling back migrations (version: {version})...")
+        logger.info("Rolling back migrations (version: %s)...", version)
 
         config = self.get_aerich_config()
         command = Command(
@@ -157,7 +157,7 @@ class MigrationManager:
             await command.downgrade(version=version, delete=True)
             logger.info("✓ Rollback completed successfully")
         except Exception as e:
-            logger.error(f"Rollback failed: {e}")
+            logger.error("Rollback failed: %s", e)
             raise
 
     async def status(self):
@@ -181,7 +181,7 @@ class MigrationManager:
             await command.heads()
             logger.info("Migration status displayed")
         except Exception as e:
-            logger.error(f"Status check failed: {e}")
+            logger.error("Status check failed: %s", e)
             raise
 
     async def make_migration(self, name: str):
@@ -195,7 +195,7 @@ class MigrationManager:
         """
         from aerich import Command
 
-        logger.info(f"Creating migration: {name}")
+        logger.info("Creating migration: %s", name)
 
         config = self.get_aerich_config()
         command = Command(
@@ -211,11 +211,11 @@ class MigrationManager:
             migration_file = await command.migrate(name=name)
 
             if migration_file:
-                logger.info(f"✓ Migration created: {migration_file}")
+                logger.info("✓ Migration created: %s", migration_file)
             else:
                 logger.info("No changes detected - no migration created")
         except Exception as e:
-            logger.error(f"Migration creation failed: {e}")
+            logger.error("Migration creation failed: %s", e)
             raise
 
     async def fresh(self):
@@ -285,7 +285,7 @@ class MigrationManager:
                     break
             logger.info("✓ Reset completed successfully")
         except Exception as e:
-            logger.error(f"Reset failed: {e}")
+            logger.error("Reset failed: %s", e)
             raise
 
     def list_migrations(self) -> List[str]:
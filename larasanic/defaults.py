@@ -46,6 +46,7 @@ DEFAULT_SESSION_LOTTERY = [2, 100]  # [chances, out_of] for garbage collection
 
 DEFAULT_CACHE_TTL = 3600  # seconds (1 hour)
 DEFAULT_CORS_MAX_AGE = 3600  # seconds (for CORS preflight cache)
+DEFAULT_CORS_PREFLIGHT_CACHE_SIZE = 256  # preflight header sets kept per CorsMiddleware
 
 # ============================================================================
 # SECURITY DEFAULTS
@@ -86,6 +87,11 @@ DEFAULT_WS_PATH = '/ws'
 DEFAULT_BLADE_CACHE_MAX_SIZE = 1000  # templates
 DEFAULT_BLADE_CACHE_TTL = 3600  # seconds
 DEFAULT_BLADE_FILE_EXTENSION = '.html'
+DEFAULT_BLADE_RENDER_WORKERS = 8  # dedicated render threads
+DEFAULT_BLADE_RENDER_CACHE_TTL = 30  # seconds (rendered HTML, only if template.RENDER_CACHE_ENABLED)
+DEFAULT_BLADE_RENDER_CACHE_SIZE = 512  # rendered pages
+DEFAULT_BLADE_RENDER_CACHE_SKIP_KEYS = ('csrf_token', 'flash', 'errors', 'old', 'user', 'auth')
+DEFAULT_SPA_NON_SPA_PREFIXES = ('/api/', '/ws/', '/static/')  # paths SpaMiddleware never renders
 
 # ============================================================================
 # AUTHENTICATION DEFAULTS
@@ -110,4 +116,4 @@ DEFAULT_PAGINATION_PER_PAGE = 20
 # FILE OPERATION DEFAULTS
 # ============================================================================
 
-DEFAULT_FILE_CHUNK_SIZE = 8192  # bytes (8KB)
\ No newline at end of file
+DEFAULT_FILE_CHUNK_SIZE = 8192  # bytes (8KB)
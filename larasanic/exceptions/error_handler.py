@@ -179,17 +179,17 @@ class ErrorHandler:
         # Log at appropriate level
         if status_code >= 500:
             self.logger.error(
-                f"{status_code} Error: {error.__class__.__name__}",
+                "%s Error: %s", status_code, error.__class__.__name__,
                 extra=log_data,
                 exc_info=True
             )
         elif status_code >= 400:
             self.logger.warning(
-                f"{status_code} Error: {error.__class__.__name__}",
+                "%s Error: %s", status_code, error.__class__.__name__,
                 extra=log_data
             )
         else:
             self.logger.info(
-                f"{status_code} Response",
+                "%s Response", status_code,
                 extra=log_data
             )
@@ -72,7 +72,7 @@ class URLValidator:
         # Check for blocked protocols
         for pattern in cls.BLOCKED_PATTERNS:
             if url.lower().startswith(pattern):
-                logger.warning(f"Blocked URL protocol: {pattern} in {url}")
+                logger.warning("Blocked URL protocol: %s in %s", pattern, url)
                 return False
 
         # Parse URL
@@ -83,7 +83,7 @@ class URLValidator:
 
         # Ensure HTTP/HTTPS only
         if parsed.scheme not in ('http', 'https'):
-            logger.warning(f"Invalid URL scheme: {parsed.scheme}")
+            logger.warning("Invalid URL scheme: %s", parsed.scheme)
             return False
 
         # Check for private IPs (SSRF prevention)
@@ -91,7 +91,7 @@ class URLValidator:
             hostname = parsed.hostname.lower()
             for private_range in cls.PRIVATE_IP_RANGES:
                 if hostname.startswith(private_range):
-                    logger.warning(f"Blocked private IP: {hostname}")
+                    logger.warning("Blocked private IP: %s", hostname)
                     return False
 
         return True
@@ -438,7 +438,7 @@ class AsyncHTTPClient(SecureHTTPClient):
                 if attempt < self.max_retries - 1:
                     await asyncio.sleep(2 ** attempt)
 
-                logger.warning(f"Request failed (attempt {attempt + 1}/{self.max_retries}): {e}")
+                logger.warning("Request failed (attempt %s/%s): %s", attempt + 1, self.max_retries, e)
 
         # All retries failed
         raise last_error or Exception("Request failed")
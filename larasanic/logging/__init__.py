@@ -8,7 +8,10 @@ structured JSON logging with sensitive data filtering.
 from larasanic.logging.logger_config import (
     LoggerConfig,
     JSONFormatter,
-    SensitiveDataFilter
+    SensitiveDataFilter,
+    RedactingFormatter,
+    LazyLoggerAdapter,
+    LazyRotatingFileHandler
 )
 import logging
 from typing import Optional
@@ -17,6 +20,9 @@ __all__ = [
     'LoggerConfig',
     'JSONFormatter',
     'SensitiveDataFilter',
+    'RedactingFormatter',
+    'LazyLoggerAdapter',
+    'LazyRotatingFileHandler',
     'getLogger',
     'INFO',
     'DEBUG',
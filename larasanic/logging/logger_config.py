@@ -1,13 +1,64 @@
 """
 Logging Configuration
 Provides structured logging with security features
+
+Log with %-style arguments, not f-strings:
+
+    logger.info("User %s logged in", user_id)    # formatted only if INFO is enabled
+    logger.info(f"User {user_id} logged in")     # formatted on every call
+
+Guard arguments that are expensive to build with logger.isEnabledFor(level).
 """
+import atexit
+import copy
 import logging
+import warnings
 import logging.handlers
+import os
 import json
+import queue
 import re
-from typing import Dict, List, Optional
-from datetime import datetime
+import time
+from typing import Any, Callable, Dict, List, Match, Optional, Tuple
+
+# orjson for fast JSON log lines, stdlib json as fallback
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+# google-re2 (linear-time matching) for the redaction regex, stdlib re as fallback
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+    re2 = None
+
+# LogRecord attributes that are not user-supplied extra fields
+_LOGRECORD_STANDARD = frozenset({
+    'name', 'msg', 'args', 'created', 'filename', 'funcName',
+    'levelname', 'levelno', 'lineno', 'module', 'msecs',
+    'pathname', 'process', 'processName', 'relativeCreated',
+    'thread', 'threadName', 'exc_info', 'exc_text', 'stack_info',
+    'getMessage', 'message', 'taskName',
+})
+
+# Timestamp format (seconds precision, milliseconds appended)
+_STRFTIME_FMT = '%Y-%m-%dT%H:%M:%S'
+
+
+def _dumps(data: Dict[str, Any]) -> str:
+    """Serialize a log record dict to a JSON string"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(data).decode('utf-8')
+        except TypeError:
+            # Values orjson rejects (e.g. ints over 64 bits) get stdlib json's handling
+            pass
+    return json.dumps(data)
 
 
 class SensitiveDataFilter(logging.Filter):
@@ -16,24 +67,18 @@ class SensitiveDataFilter(logging.Filter):
     Prevents password, token, API key, and other sensitive data leakage
     """
 
-    SENSITIVE_PATTERNS = {
+    # JSON fields whose value is replaced, keeping the key: "password": "[REDACTED]"
+    JSON_FIELDS = (
         # Password fields
-        'password': r'("password"\s*:\s*)"[^"]*"',
-        'passwd': r'("passwd"\s*:\s*)"[^"]*"',
-        'pwd': r'("pwd"\s*:\s*)"[^"]*"',
-        'password_hash': r'("password_hash"\s*:\s*)"[^"]*"',
-        'password_confirmation': r'("password_confirmation"\s*:\s*)"[^"]*"',
-
+        'password', 'passwd', 'pwd', 'password_hash', 'password_confirmation',
         # API keys and tokens
-        'api_key': r'("api_key"\s*:\s*)"[^"]*"',
-        'api_secret': r'("api_secret"\s*:\s*)"[^"]*"',
-        'token': r'("token"\s*:\s*)"[^"]*"',
-        'access_token': r'("access_token"\s*:\s*)"[^"]*"',
-        'refresh_token': r'("refresh_token"\s*:\s*)"[^"]*"',
-        'bearer_token': r'("bearer_token"\s*:\s*)"[^"]*"',
-        'jwt': r'("jwt"\s*:\s*)"[^"]*"',
-        'secret': r'("secret"\s*:\s*)"[^"]*"',
-        'secret_key': r'("secret_key"\s*:\s*)"[^"]*"',
+        'api_key', 'api_secret', 'token', 'access_token', 'refresh_token',
+        'bearer_token', 'jwt', 'secret', 'secret_key',
+    )
+
+    SENSITIVE_PATTERNS = {
+        # Password, API key and token JSON fields (one alternation instead of a pattern per field)
+        'json_field': r'("(?:' + '|'.join(JSON_FIELDS) + r')"\s*:\s*)"[^"]*"',
 
         # Credit card numbers (basic pattern)
         'credit_card': r'\b\d{4}[\s-]?\d{4}[\s-]?\d{4}[\s-]?\d{4}\b',
@@ -47,10 +92,31 @@ class SensitiveDataFilter(logging.Filter):
         # Authorization headers
         'auth_header': r'(Authorization:\s+Bearer\s+)[A-Za-z0-9\-_=]+\.[A-Za-z0-9\-_=]+\.?[A-Za-z0-9\-_.+/=]*',
 
-        # Private keys
-        'private_key': r'-----BEGIN\s+(?:RSA\s+)?PRIVATE\s+KEY-----[\s\S]+?-----END\s+(?:RSA\s+)?PRIVATE\s+KEY-----',
+        # Private keys (scoped DOTALL: the body spans lines)
+        'private_key': r'-----BEGIN\s+(?:RSA\s+)?PRIVATE\s+KEY-----(?s:.+?)-----END\s+(?:RSA\s+)?PRIVATE\s+KEY-----',
+    }
+
+    # Patterns whose first group is kept in front of the replacement
+    PREFIX_REPLACEMENTS = {
+        'json_field': '"[REDACTED]"',
+        'email_password': '[REDACTED]',
+        'auth_header': '[REDACTED]',
     }
 
+    # Texts at least this long use RE2 (when installed): its per-call overhead is
+    # higher, but it scans in linear time where re keeps retrying alternatives
+    RE2_MIN_LENGTH = 512
+
+    # Built-in patterns without letters, matched without case folding
+    CASELESS_EXEMPT = frozenset({'credit_card', 'ssn'})
+
+    # Lowercase substrings at least one of which every non-numeric built-in match contains
+    TRIGGERS = ('passw', 'pwd', 'api_', 'token', 'jwt', 'secret', 'authorization', '-----begin')
+
+    # Credit card and SSN matches both contain a run of 3 digits
+    _DIGIT_RUN_RE = re.compile(r'\d{3}')
+    _DIGIT_RUN_BYTES_RE = re.compile(rb'\d{3}')
+
     def __init__(self, additional_patterns: Optional[Dict[str, str]] = None):
         """
         Initialize sensitive data filter
@@ -62,37 +128,191 @@ class SensitiveDataFilter(logging.Filter):
         if additional_patterns:
             self.patterns.update(additional_patterns)
 
+        # Custom patterns can match anything, so they disable the pre-screening
+        self._triggers = None if additional_patterns else self.TRIGGERS
+        self._byte_triggers = None if additional_patterns else tuple(t.encode() for t in self.TRIGGERS)
+
         # Compile all patterns
         self.compiled_patterns = {
             name: re.compile(pattern, re.IGNORECASE)
             for name, pattern in self.patterns.items()
         }
 
+        # Fuse the built-in patterns into one alternation so each text is scanned once;
+        # every pattern gets a named group telling the dispatcher which one matched
+        builtin = tuple(
+            name for name, pattern in self.patterns.items() if self.SENSITIVE_PATTERNS.get(name) == pattern
+        )
+        groups, source = self._fused_source(builtin)
+        self._fused = re.compile(source)
+        self._fused_re2 = self._compile_re2(source)
+        self._replacers = {
+            group: self._make_replacer(name, self._fused.groupindex[group], names=builtin)
+            for group, name in groups.items()
+        }
+
+        # Custom patterns run as their own sub() after the fused pass: splicing them into
+        # the alternation breaks inline global flags ((?i), (?x)) and numbered backreferences
+        self._custom_subs = [
+            (self.compiled_patterns[name], self._make_replacer(name, 0, names=builtin))
+            for name in self.patterns if name not in builtin
+        ]
+
+        # Same regexes over bytes, so bytes messages skip a decode/encode round-trip
+        self._fused_bytes = re.compile(source.encode('utf-8'))
+        self._byte_replacers = {
+            group: self._make_replacer(name, self._fused_bytes.groupindex[group], as_bytes=True, names=builtin)
+            for group, name in groups.items()
+        }
+        try:
+            self._custom_byte_subs = [
+                (re.compile(self.patterns[name].encode('utf-8'), re.IGNORECASE),
+                 self._make_replacer(name, 0, as_bytes=True, names=builtin))
+                for name in self.patterns if name not in builtin
+            ]
+        except re.error:
+            # Custom patterns that only work on str: bytes go through decoding
+            self._custom_byte_subs = None
+
+    def _fused_source(self, names: Tuple[str, ...]):
+        """
+        Build the alternation of the given built-in patterns, each in a named group
+
+        Letter patterns get a scoped (?i:...) group instead of a global IGNORECASE.
+        Only built-ins are fused: a custom pattern with a leading inline flag like
+        (?x) would still fail inside the wrapper, so those are compiled separately.
+
+        Args:
+            names: Built-in pattern names to fuse
+
+        Returns:
+            Tuple of (group name -> pattern name, regex source)
+        """
+        groups = {f'_r{index}': name for index, name in enumerate(names)}
+        source = '|'.join(
+            f'(?P<{group}>{self.patterns[name]})' if name in self.CASELESS_EXEMPT
+            else f'(?P<{group}>(?i:{self.patterns[name]}))'
+            for group, name in groups.items()
+        )
+        # No names (every built-in overridden by a custom pattern): a regex that never matches
+        return groups, source or '(?!)'
+
+    @staticmethod
+    def _compile_re2(source: str):
+        """
+        Compile the fused redaction pattern with RE2
+
+        Args:
+            source: Fused regex source
+
+        Returns:
+            Compiled RE2 pattern, or None if RE2 is unavailable or rejects the pattern
+        """
+        if not RE2_AVAILABLE:
+            return None
+        try:
+            return re2.compile(source)
+        except Exception:
+            # Syntax RE2 doesn't support (e.g. backreferences in custom patterns)
+            return None
+
+    def _fuse_subset(self, names: Tuple[str, ...], as_bytes: bool) -> Callable[[Any], Any]:
+        """
+        Build a redaction callback fusing only some of the patterns
+
+        Args:
+            names: Pattern names to fuse
+            as_bytes: Build the callback for bytes
+
+        Returns:
+            Callback redacting a text with the given patterns
+        """
+        groups, source = self._fused_source(names)
+        fused = re.compile(source.encode('utf-8') if as_bytes else source)
+        replacers = {
+            group: self._make_replacer(name, fused.groupindex[group], as_bytes=as_bytes, names=names)
+            for group, name in groups.items()
+        }
+        return lambda text: fused.sub(lambda match: replacers[match.lastgroup](match), text)
+
+    def _make_replacer(
+        self, name: str, group_index: int, as_bytes: bool = False, names: Tuple[str, ...] = ()
+    ) -> Callable[[Match], Any]:
+        """
+        Build the replacement callback for a pattern in the fused regex
+
+        Args:
+            name: Pattern name
+            group_index: Index of the pattern's named group in the fused regex (0 when
+                the pattern is compiled on its own)
+            as_bytes: Build the callback for the bytes regex
+            names: Names of the patterns fused together with this one
+
+        Returns:
+            Callback returning the replacement for a match
+        """
+        def literal(value: str):
+            return value.encode('utf-8') if as_bytes else value
+
+        # The pattern's own first group (kept prefix) follows its named group (or the whole match)
+        has_prefix = self.compiled_patterns[name].groups > 0
+        prefix_index = group_index + 1
+
+        if name in self.PREFIX_REPLACEMENTS and has_prefix:
+            # JSON field, query string password or auth header value. The kept prefix
+            # can span other sensitive data (email=.*&password= is greedy) that the
+            # leftmost match swallowed, so it goes through the remaining patterns
+            replacement = literal(self.PREFIX_REPLACEMENTS[name])
+            others = tuple(other for other in names if other != name)
+            if not others:
+                return lambda match: match.group(prefix_index) + replacement
+            redact = self._fuse_subset(others, as_bytes)
+            return lambda match: redact(match.group(prefix_index)) + replacement
+        if name == 'credit_card':
+            # Redact credit card, keep last 4 digits
+            dash, space, empty, mask = literal('-'), literal(' '), literal(''), literal('****-****-****-')
+            return lambda match: mask + match.group(0).replace(dash, empty).replace(space, empty)[-4:]
+        if name == 'ssn':
+            replacement = literal('***-**-****')
+        elif name == 'private_key':
+            replacement = literal('[REDACTED PRIVATE KEY]')
+        else:
+            replacement = literal('[REDACTED]')
+        return lambda match: replacement
+
     def filter(self, record: logging.LogRecord) -> bool:
         """
         Filter log record to redact sensitive data
         Returns:
             True (always pass the record, but with redacted content)
         """
-        # Redact sensitive data from message
-        if isinstance(record.msg, str):
-            record.msg = self._redact_sensitive_data(record.msg)
-
-        # Redact from args if present
-        if record.args:
-            if isinstance(record.args, dict):
-                record.args = {
-                    k: self._redact_sensitive_data(str(v)) if isinstance(v, str) else v
-                    for k, v in record.args.items()
-                }
-            elif isinstance(record.args, tuple):
-                record.args = tuple(
-                    self._redact_sensitive_data(str(arg)) if isinstance(arg, str) else arg
-                    for arg in record.args
-                )
-
+        self._redact_record(record)
         return True
 
+    def _redact_record(self, record: logging.LogRecord):
+        """
+        Redact a record's message once, after interpolating its args
+
+        Args:
+            record: Log record (message replaced in place, args cleared)
+        """
+        if isinstance(record.msg, (bytes, bytearray)) and not record.args:
+            record.msg = self._redact_sensitive_bytes(bytes(record.msg))
+            return
+
+        try:
+            message = record.getMessage()
+        except Exception:
+            # Broken format/args: leave the record for the handler to report
+            return
+
+        record.msg = self._redact_sensitive_data(message)
+        record.args = None
+
+    def _dispatch(self, match: Match) -> str:
+        """Replace a fused-regex match using the callback of the pattern that matched"""
+        return self._replacers[match.lastgroup](match)
+
     def _redact_sensitive_data(self, text: str) -> str:
         """
         Redact sensitive data from text
@@ -100,34 +320,79 @@ class SensitiveDataFilter(logging.Filter):
         Returns:
             Text with sensitive data redacted
         """
-        redacted = text
-
-        for name, pattern in self.compiled_patterns.items():
-            if name in ['password', 'passwd', 'pwd', 'password_hash', 'password_confirmation',
-                       'api_key', 'api_secret', 'token', 'access_token', 'refresh_token',
-                       'bearer_token', 'jwt', 'secret', 'secret_key']:
-                # JSON field redaction
-                redacted = pattern.sub(r'\1"[REDACTED]"', redacted)
-            elif name == 'credit_card':
-                # Redact credit card, keep last 4 digits
-                def redact_cc(match):
-                    cc = match.group(0).replace('-', '').replace(' ', '')
-                    return f"****-****-****-{cc[-4:]}"
-                redacted = pattern.sub(redact_cc, redacted)
-            elif name == 'ssn':
-                # Redact SSN
-                redacted = pattern.sub('***-**-****', redacted)
-            elif name == 'email_password':
-                # Redact password from query string
-                redacted = pattern.sub(r'\1[REDACTED]', redacted)
-            elif name == 'auth_header':
-                # Redact auth header
-                redacted = pattern.sub(r'\1[REDACTED]', redacted)
-            elif name == 'private_key':
-                # Redact private keys
-                redacted = pattern.sub('[REDACTED PRIVATE KEY]', redacted)
-
-        return redacted
+        # Most log lines hold nothing sensitive: skip the regex when no trigger appears
+        if self._triggers is not None:
+            lowered = text.lower()
+            if not any(trigger in lowered for trigger in self._triggers) \
+               and self._DIGIT_RUN_RE.search(text) is None:
+                return text
+
+        if self._fused_re2 is not None and len(text) >= self.RE2_MIN_LENGTH:
+            text = self._fused_re2.sub(self._dispatch, text)
+        else:
+            text = self._fused.sub(self._dispatch, text)
+        for pattern, replacer in self._custom_subs:
+            text = pattern.sub(replacer, text)
+        return text
+
+    def _dispatch_bytes(self, match: Match) -> bytes:
+        """Replace a bytes fused-regex match using the callback of the pattern that matched"""
+        return self._byte_replacers[match.lastgroup](match)
+
+    def _redact_sensitive_bytes(self, data: bytes) -> bytes:
+        """
+        Redact sensitive data from UTF-8 bytes
+
+        Returns:
+            Bytes with sensitive data redacted
+        """
+        if self._custom_byte_subs is None:
+            return self._redact_sensitive_data(data.decode('utf-8', 'surrogateescape')).encode('utf-8', 'surrogateescape')
+
+        if self._byte_triggers is not None:
+            lowered = data.lower()
+            if not any(trigger in lowered for trigger in self._byte_triggers) \
+               and self._DIGIT_RUN_BYTES_RE.search(data) is None:
+                return data
+
+        data = self._fused_bytes.sub(self._dispatch_bytes, data)
+        for pattern, replacer in self._custom_byte_subs:
+            data = pattern.sub(replacer, data)
+        return data
+
+
+class RedactingFormatter(logging.Formatter):
+    """
+    Formatter wrapper that redacts sensitive data before formatting
+
+    The message is interpolated and redacted in a single pass, then handed to
+    the wrapped formatter (JSON or text).
+    """
+
+    def __init__(self, base_formatter: logging.Formatter, sensitive_filter: SensitiveDataFilter):
+        """
+        Initialize redacting formatter
+
+        Args:
+            base_formatter: Formatter producing the final output
+            sensitive_filter: Filter providing the redaction patterns
+        """
+        super().__init__()
+        self._base = base_formatter
+        self._filter = sensitive_filter
+
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Redact the record's message, then format it with the wrapped formatter
+
+        Args:
+            record: Log record to format
+
+        Returns:
+            Formatted log string
+        """
+        self._filter._redact_record(record)
+        return self._base.format(record)
 
 
 class JSONFormatter(logging.Formatter):
@@ -146,6 +411,26 @@ class JSONFormatter(logging.Formatter):
         """
         super().__init__()
         self.include_fields = include_fields or []
+        # (second, formatted) for the last second seen, records mostly share it
+        self._cached_timestamp = (None, '')
+
+    def _format_timestamp(self, created: float, msecs: float) -> str:
+        """
+        Format a record's creation time as ISO 8601 with milliseconds
+
+        Args:
+            created: Record creation time (epoch seconds)
+            msecs: Millisecond part of the creation time
+
+        Returns:
+            Timestamp string (e.g., 2024-01-15T10:30:00.123)
+        """
+        second = int(created)
+        cached_second, formatted = self._cached_timestamp
+        if second != cached_second:
+            formatted = time.strftime(_STRFTIME_FMT, time.localtime(second))
+            self._cached_timestamp = (second, formatted)
+        return f"{formatted}.{int(msecs):03d}"
 
     def format(self, record: logging.LogRecord) -> str:
         """
@@ -158,7 +443,7 @@ class JSONFormatter(logging.Formatter):
             JSON formatted log string
         """
         log_data = {
-            'timestamp': datetime.fromtimestamp(record.created).isoformat(),
+            'timestamp': self._format_timestamp(record.created, record.msecs),
             'level': record.levelname,
             'logger': record.name,
             'message': record.getMessage(),
@@ -182,20 +467,101 @@ class JSONFormatter(logging.Formatter):
 
         # Add extra fields from record.__dict__
         for key, value in record.__dict__.items():
-            if key not in ['name', 'msg', 'args', 'created', 'filename', 'funcName',
-                          'levelname', 'levelno', 'lineno', 'module', 'msecs',
-                          'pathname', 'process', 'processName', 'relativeCreated',
-                          'thread', 'threadName', 'exc_info', 'exc_text', 'stack_info',
-                          'getMessage', 'message']:
+            if key not in _LOGRECORD_STANDARD:
                 log_data[key] = value
 
-        return json.dumps(log_data)
+        return _dumps(log_data)
+
+
+class LazyLoggerAdapter(logging.LoggerAdapter):
+    """
+    Logger adapter for the %-style logging convention
+
+    Warns once when a call passes arguments but its message has no % placeholder,
+    which usually means the message was already formatted (e.g. an f-string).
+    """
+
+    _warned = False
+
+    def log(self, level: int, msg, *args, **kwargs):
+        if args and not LazyLoggerAdapter._warned and isinstance(msg, str) and '%' not in msg:
+            LazyLoggerAdapter._warned = True
+            warnings.warn(
+                f"Log message {msg!r} has arguments but no % placeholder; "
+                "pass the format string and its arguments separately",
+                stacklevel=3
+            )
+        super().log(level, msg, *args, **kwargs)
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that leaves formatting and redaction to the listener thread
+
+    The queue is in-process, so the record keeps its exc_info; only the args are
+    interpolated here, since they may change after the call returns.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class LazyRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    Rotating file handler that touches the filesystem on first write
+
+    The file is opened with delay=True, and its directory is created only
+    when the stream is first opened, so loggers that never write cost no syscalls.
+    """
+
+    def __init__(self, filename, **kwargs):
+        kwargs['delay'] = True
+        super().__init__(filename, **kwargs)
+        self._directory_ready = False
+
+    def _open(self):
+        if not self._directory_ready:
+            from larasanic.support import Storage
+            Storage.ensure_directory(os.path.dirname(self.baseFilename))
+            self._directory_ready = True
+        return super()._open()
+
+
+# Queue listeners by logger name (kept alive, stopped at exit)
+_listeners: Dict[Optional[str], logging.handlers.QueueListener] = {}
 
 
 class LoggerConfig:
     """
     Centralized logging configuration
     """
+    @staticmethod
+    def stop_listeners():
+        """Stop all log queue listeners, writing out any queued records"""
+        while _listeners:
+            _, listener = _listeners.popitem()
+            listener.stop()
+
+    @staticmethod
+    def get_logger(name: Optional[str] = None) -> LazyLoggerAdapter:
+        """
+        Get a logger wrapped for the %-style logging convention
+
+        Args:
+            name: Logger name
+
+        Returns:
+            Logger adapter
+
+        Example:
+            logger = LoggerConfig.get_logger('application')
+            logger.info("Order %s shipped", order_id)
+        """
+        return LazyLoggerAdapter(logging.getLogger(name))
+
     @staticmethod
     def setup_logger(
         name: str,
@@ -253,10 +619,9 @@ class LoggerConfig:
         # Use file_name if provided, otherwise use logger name
         log_filename = file_name if file_name else name
         log_file = Storage.logs(f"{log_filename}.log")
-        Storage.ensure_directory(log_file.parent)
-        
-        # Create rotating file handler
-        handler = logging.handlers.RotatingFileHandler(
+
+        # Create rotating file handler (file and directory are created on first write)
+        handler = LazyRotatingFileHandler(
             log_file,
             maxBytes=max_bytes,
             backupCount=backup_count,
@@ -271,22 +636,30 @@ class LoggerConfig:
                 '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
             )
 
-        handler.setFormatter(formatter)
-
-        # Add sensitive data filter
+        # Redact sensitive data once per record, after interpolation
         if filter_sensitive:
             sensitive_filter = SensitiveDataFilter(additional_sensitive_patterns)
-            handler.addFilter(sensitive_filter)
+            formatter = RedactingFormatter(formatter, sensitive_filter)
 
-        logger.addHandler(handler)
+        handler.setFormatter(formatter)
+        handlers = [handler]
 
         # Add console handler if requested
         if enable_console:
             console_handler = logging.StreamHandler()
             console_handler.setFormatter(formatter)
-            if filter_sensitive:
-                console_handler.addFilter(sensitive_filter)
-            logger.addHandler(console_handler)
+            handlers.append(console_handler)
+
+        # Format, redact and write on a background thread, off the event loop
+        previous_listener = _listeners.pop(name, None)
+        if previous_listener is not None:
+            previous_listener.stop()
+
+        log_queue = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        _listeners[name] = listener
+        logger.addHandler(_DeferredQueueHandler(log_queue))
 
         # Prevent propagation to avoid duplicate logs
         logger.propagate = False
@@ -311,3 +684,7 @@ class LoggerConfig:
             'testing': logging.ERROR,
         }
         return levels.get(environment.lower(), logging.INFO)
+
+
+# Write out queued records before logging.shutdown() flushes the handlers
+atexit.register(LoggerConfig.stop_listeners)
@@ -7,6 +7,9 @@ from larasanic.http import ResponseHelper
 from sanic import Request
 from typing import Optional
 from larasanic.support.facades import HttpRequest
+from larasanic.logging import getLogger
+
+logger = getLogger(__name__)
 
 class AuthMiddleware(Middleware):
     """
@@ -70,9 +73,9 @@ class AuthMiddleware(Middleware):
             # Continue to next middleware/handler
             return None
 
-        except Exception as e:
-            # If auth service fails, treat as unauthenticated
-            print(f"⚠️  Auth middleware error: {e}")
+        except RuntimeError as e:
+            # No request context for the facade: treat as unauthenticated
+            logger.warning("Auth middleware error: %s", e)
             return self._handle_unauthenticated(request)
 
     async def after_response(self, request: Request, response):
@@ -98,8 +101,10 @@ class AuthMiddleware(Middleware):
         Returns:
             HTTPResponse: 401 JSON for API, redirect for web
         """
-        # Use HttpRequest facade for consistent request type detection
-        if HttpRequest.wants_json():
+        # Same detection as HttpRequest.wants_json(), read straight from the
+        # request analysis already stored on this request's ctx
+        analysis = getattr(request.ctx, '_request_analysis', None) or {}
+        if analysis.get('wants_json', False):
             return ResponseHelper.unauthorized("Authentication required")
         else:
             return ResponseHelper.redirect(self.redirect_to)
@@ -5,9 +5,14 @@ Beats sanic-ext with: regex patterns, per-route config, Vary header, header filt
 """
 from larasanic.middleware.base_middleware import Middleware
 from larasanic.http import ResponseHelper
+from larasanic.support.facades import HttpRequest, HttpResponse
 from sanic import Request
-from typing import Optional, Union, List, Pattern
+from typing import Dict, Optional, Union, List, Pattern
 import re
+import string
+
+# ASCII-only lowercasing for header names (cheaper than str.lower's Unicode handling)
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
 
 
 class CorsConfigurationError(Exception):
@@ -59,6 +64,9 @@ class CorsMiddleware(Middleware):
         self.origin_patterns = self._parse_origins(allowed_origins or ['*'])
         self.wildcard_origin = any(p.pattern == '.*' for p in self.origin_patterns)
 
+        # Exact origins are checked with a set lookup, only wildcards need a regex
+        self._exact_origins, self._wild_patterns = self._split_origins(allowed_origins or ['*'])
+
         self.allowed_methods = [m.upper() for m in (allowed_methods or
             ['GET', 'POST', 'PUT', 'DELETE', 'PATCH', 'OPTIONS'])]
 
@@ -75,6 +83,26 @@ class CorsMiddleware(Middleware):
         self.allow_credentials = allow_credentials
         self.max_age = max_age
 
+        # Header values that never change after init
+        self._methods_header = ', '.join(self.allowed_methods)
+        self._expose_header = ', '.join(self.expose_headers) if self.expose_headers else None
+        self._max_age_str = str(self.max_age)
+        self._vary_needed = len(self.origin_patterns) > 1
+
+        # Response headers that don't depend on the request
+        self._static_response_headers: Dict[str, str] = {}
+        if self.allow_credentials:
+            self._static_response_headers['Access-Control-Allow-Credentials'] = 'true'
+        if self.expose_headers and '*' not in self.expose_headers:
+            self._static_response_headers['Access-Control-Expose-Headers'] = self._expose_header
+        if self._vary_needed:
+            self._static_response_headers['Vary'] = 'Origin'
+
+        # Preflight headers (minus the origin) per (requested headers, credentials)
+        from larasanic.defaults import DEFAULT_CORS_PREFLIGHT_CACHE_SIZE
+        self._preflight_cache: Dict[tuple, Dict[str, str]] = {}
+        self._preflight_cache_max = DEFAULT_CORS_PREFLIGHT_CACHE_SIZE
+
         # Validate CORS configuration (security check)
         if self.wildcard_origin and self.allow_credentials:
             raise CorsConfigurationError(
@@ -116,17 +144,36 @@ class CorsMiddleware(Middleware):
 
         return patterns
 
+    def _split_origins(self, origins: Union[str, List[str], Pattern]) -> tuple:
+        """
+        Split origins into exact strings and wildcard/regex patterns
+
+        Returns:
+            Tuple of (frozenset of exact origins, tuple of compiled patterns)
+        """
+        if isinstance(origins, Pattern):
+            return frozenset(), (origins,)
+
+        if isinstance(origins, str):
+            origins = [origins]
+
+        exact = frozenset(origin for origin in origins if '*' not in origin)
+        wild = tuple(self._parse_origins([origin for origin in origins if '*' in origin]))
+        return exact, wild
+
     def _is_origin_allowed(self, origin: str) -> bool:
         """Check if origin matches any allowed pattern"""
         if not origin:
             return False
 
-        return any(pattern.match(origin) for pattern in self.origin_patterns)
+        if self.wildcard_origin or origin in self._exact_origins:
+            return True
+
+        return any(pattern.match(origin) for pattern in self._wild_patterns)
 
     def _has_credentials(self, request: Request) -> bool:
         """Check if request includes credentials (cookies or auth)"""
-        from larasanic.support.facades import HttpRequest
-        return bool(HttpRequest.bearer_token() or request.cookies)
+        return 'authorization' in request.headers or bool(request.cookies)
 
     def _get_cors_origin_header(self, origin: Optional[str]) -> Optional[str]:
         """
@@ -140,30 +187,29 @@ class CorsMiddleware(Middleware):
 
         return None
 
-    def _get_allowed_headers(self, with_credentials: bool) -> Optional[List[str]]:
+    def _get_allowed_headers(self, with_credentials: bool, requested: str) -> Optional[List[str]]:
         """
         Get allowed headers for response
+
+        Args:
+            with_credentials: Whether the request carries credentials
+            requested: Access-Control-Request-Headers value from the preflight
         """
-        from larasanic.support.facades import HttpRequest
         # If wildcard and no credentials, allow all
         if self.allowed_headers == '*' and not with_credentials:
             return ['*']
 
-        # Get requested headers from preflight
-        requested = HttpRequest.get_header('access-control-request-headers', '')
         if not requested:
             return None
 
-        requested_headers = set(h.strip().lower() for h in requested.split(','))
-
-        # Filter: only allow headers that are both requested AND allowed
-        if self.allowed_headers == '*':
-            # With credentials: allow all requested headers
-            return list(requested_headers)
-        else:
-            # Filter to only allowed headers
-            allowed = requested_headers & self.allowed_headers
-            return list(allowed) if allowed else None
+        # Keep headers that are both requested AND allowed (all requested for wildcard)
+        allow_all = self.allowed_headers == '*'
+        allowed = []
+        for part in requested.split(','):
+            header = part.strip().translate(_ASCII_LOWER)
+            if (allow_all or header in self.allowed_headers) and header not in allowed:
+                allowed.append(header)
+        return allowed or None
 
     async def before_request(self, request: Request):
         """Handle CORS preflight requests"""
@@ -173,7 +219,6 @@ class CorsMiddleware(Middleware):
 
     async def after_response(self, request: Request, response):
         """Add CORS headers to response"""
-        from larasanic.support.facades import HttpRequest
         origin = HttpRequest.get_header('origin')
 
         if not origin:
@@ -184,32 +229,20 @@ class CorsMiddleware(Middleware):
         if not cors_origin:
             return response  # Origin not allowed
 
-        from larasanic.support.facades import HttpResponse
-
-        HttpResponse.header('Access-Control-Allow-Origin', cors_origin)
+        headers = {'Access-Control-Allow-Origin': cors_origin}
+        headers.update(self._static_response_headers)
 
-        # Add credentials header
-        if self.allow_credentials:
-            HttpResponse.header('Access-Control-Allow-Credentials', 'true')
-
-        # Add expose headers
-        if self.expose_headers:
+        # Wildcard expose doesn't work with credentials per MDN spec
+        if '*' in self.expose_headers:
             with_credentials = self._has_credentials(request)
-            # Wildcard doesn't work with credentials per MDN spec
-            if '*' in self.expose_headers and not with_credentials:
-                HttpResponse.header('Access-Control-Expose-Headers', '*')
-            else:
-                HttpResponse.header('Access-Control-Expose-Headers', ', '.join(self.expose_headers))
+            headers['Access-Control-Expose-Headers'] = '*' if not with_credentials else self._expose_header
 
-        # Add Vary header for proper caching (important!)
-        if len(self.origin_patterns) > 1:
-            HttpResponse.header('Vary', 'Origin')
+        HttpResponse.headers(headers)
 
         return response
 
     def _build_preflight_response(self, request: Request):
         """Build response for OPTIONS preflight request"""
-        from larasanic.support.facades import HttpRequest
         origin = HttpRequest.get_header('origin')
 
         # Check if origin is allowed
@@ -218,27 +251,44 @@ class CorsMiddleware(Middleware):
             # Origin not allowed - return 403
             return ResponseHelper.error('CORS origin not allowed', status=403)
 
+        # Everything but the origin depends only on the requested headers and credentials
+        with_credentials = self._has_credentials(request)
+        requested = HttpRequest.get_header('access-control-request-headers', '')
+        key = (requested, with_credentials)
+        preflight_headers = self._preflight_cache.get(key)
+        if preflight_headers is None:
+            preflight_headers = self._build_preflight_headers(with_credentials, requested)
+            if len(self._preflight_cache) >= self._preflight_cache_max:
+                # Evict the oldest entry
+                del self._preflight_cache[next(iter(self._preflight_cache))]
+            self._preflight_cache[key] = preflight_headers
+
+        headers = {'Access-Control-Allow-Origin': cors_origin}
+        headers.update(preflight_headers)
+
+        return ResponseHelper.text('', status=204, headers=headers)
+
+    def _build_preflight_headers(self, with_credentials: bool, requested: str) -> Dict[str, str]:
+        """Build the origin-independent preflight response headers"""
         headers = {}
-        headers['Access-Control-Allow-Origin'] = cors_origin
 
         # Set allowed methods
-        headers['Access-Control-Allow-Methods'] = ', '.join(self.allowed_methods)
+        headers['Access-Control-Allow-Methods'] = self._methods_header
 
         # Set allowed headers (smart filtering)
-        with_credentials = self._has_credentials(request)
-        allowed_headers = self._get_allowed_headers( with_credentials)
+        allowed_headers = self._get_allowed_headers(with_credentials, requested)
         if allowed_headers:
             headers['Access-Control-Allow-Headers'] = ', '.join(allowed_headers)
 
         # Set max age
-        headers['Access-Control-Max-Age'] = str(self.max_age)
+        headers['Access-Control-Max-Age'] = self._max_age_str
 
         # Allow credentials
         if self.allow_credentials:
             headers['Access-Control-Allow-Credentials'] = 'true'
 
         # Add Vary header
-        if len(self.origin_patterns) > 1:
+        if self._vary_needed:
             headers['Vary'] = 'Origin'
 
-        return ResponseHelper.text('', status=204, headers=headers)
\ No newline at end of file
+        return headers
@@ -2,6 +2,7 @@
 Middleware Factory
 Centralized middleware configuration loading to eliminate duplication
 """
+from functools import lru_cache
 from typing import Optional, Dict, Any, Type
 from larasanic.middleware.base_middleware import Middleware
 from larasanic.support import Config
@@ -48,23 +49,25 @@ class MiddlewareFactory:
                 allow_credentials=True  # Static param
             )
         """
-        # Check if middleware is enabled
-        if enabled_config_key:
-            enabled = Config.get(enabled_config_key, default_enabled)
-            if not enabled:
-                return None
+        # Same class, config keys and static params -> same instance (built once)
+        mapping_key = tuple(sorted(config_mapping.items())) if config_mapping else ()
+        static_key = tuple(sorted(static_params.items()))
+        args = (middleware_class, enabled_config_key, mapping_key, default_enabled, static_key)
+        try:
+            hash(args)
+        except TypeError:
+            # Unhashable defaults or params (e.g. list defaults) can't be cached
+            return _build_middleware.__wrapped__(*args)
+        return _build_middleware(*args)
 
-        # Load configuration parameters
-        config_params = {}
-        if config_mapping:
-            for param_name, (config_key, default_value) in config_mapping.items():
-                config_params[param_name] = Config.get(config_key, default_value)
-
-        # Merge with static parameters
-        all_params = {**config_params, **static_params}
+    @staticmethod
+    def clear_cache():
+        """
+        Forget middleware built by create_from_config
 
-        # Instantiate middleware
-        return middleware_class(**all_params)
+        Call after changing configuration so the next create_from_config() reads it again.
+        """
+        _build_middleware.cache_clear()
 
     @staticmethod
     def create_with_validator(
@@ -103,3 +106,43 @@ class MiddlewareFactory:
 
         # Instantiate
         return middleware_class(**params)
+
+
+@lru_cache(maxsize=None)
+def _build_middleware(
+    middleware_class: Type[Middleware],
+    enabled_config_key: Optional[str],
+    mapping_key: tuple,
+    default_enabled: bool,
+    static_key: tuple
+) -> Optional[Middleware]:
+    """
+    Build a middleware instance from configuration
+
+    Args:
+        middleware_class: The middleware class to instantiate
+        enabled_config_key: Config key to check if middleware is enabled
+        mapping_key: Tuple of (param_name, (config_key, default_value))
+        default_enabled: Default enabled state if config key not found
+        static_key: Tuple of (param_name, value) for static parameters
+
+    Returns:
+        Middleware instance if enabled, None otherwise
+    """
+    # Check if middleware is enabled
+    if enabled_config_key:
+        enabled = Config.get(enabled_config_key, default_enabled)
+        if not enabled:
+            return None
+
+    # Load configuration parameters
+    all_params = {
+        param_name: Config.get(config_key, default_value)
+        for param_name, (config_key, default_value) in mapping_key
+    }
+
+    # Merge with static parameters
+    all_params.update(static_key)
+
+    # Instantiate middleware
+    return middleware_class(**all_params)
@@ -9,9 +9,38 @@ from sanic import Request
 import json
 import logging
 import re
+from bisect import bisect_right
 from datetime import datetime
 from larasanic.logging import getLogger
-from typing import Optional
+from typing import List, Optional
+
+# google-re2 (linear-time matching, no backtracking) for the URL scan, stdlib re as fallback
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+    re2 = None
+
+
+def _compile_patterns(patterns: List[str]):
+    """
+    Compile suspicious patterns into one case-insensitive alternation
+
+    Args:
+        patterns: Regex patterns
+
+    Returns:
+        Compiled pattern (RE2 when installed, stdlib re otherwise)
+    """
+    source = '|'.join(patterns)
+    if RE2_AVAILABLE:
+        try:
+            return re2.compile('(?i)' + source)
+        except re2.error:
+            # Syntax RE2 doesn't support (e.g. backreferences in custom patterns)
+            pass
+    return re.compile(source, re.IGNORECASE)
 
 class SecurityLoggerMiddleware(Middleware):
     """Middleware to log suspicious and malformed requests"""
@@ -34,65 +63,146 @@ class SecurityLoggerMiddleware(Middleware):
         r'proxy',  # Proxy testing
     ]
 
+    # Lowercase substrings at least one of which every SUSPICIOUS_PATTERNS match contains
+    # (a subclass overriding the patterns must override these too, or the pre-screen is skipped)
+    SUSPICIOUS_TRIGGERS = ('..', '<', 'union', 'eval(', 'base64_decode', 'phpinfo', 'admin', '.env', '.git', 'proxy')
+
+    # Request headers inspected for suspicious content (lowercase)
+    SCANNED_HEADERS = frozenset({'host', 'user-agent', 'referer'})
+
     def __init__(self):
         """
         Initialize security logger with structured logging
         """
-        self.pattern = re.compile('|'.join(self.SUSPICIOUS_PATTERNS), re.IGNORECASE)
+        # Share the module-level compiled pattern unless a subclass overrides the list
+        if self.SUSPICIOUS_PATTERNS is SecurityLoggerMiddleware.SUSPICIOUS_PATTERNS:
+            self.pattern = _SUSPICIOUS_RE
+            self._triggers = self.SUSPICIOUS_TRIGGERS
+        else:
+            self.pattern = _compile_patterns(self.SUSPICIOUS_PATTERNS)
+            custom_triggers = self.SUSPICIOUS_TRIGGERS is not SecurityLoggerMiddleware.SUSPICIOUS_TRIGGERS
+            self._triggers = self.SUSPICIOUS_TRIGGERS if custom_triggers else None
+
+        self._security_logger = getLogger('security')
+        self._malformed_logger = getLogger('malformed')
 
     async def before_request(self, request: Request):
         """Check for suspicious patterns before processing"""
         return None
 
-    async def after_response(self, request: Request, response):
-        """Log suspicious requests after processing"""
-        client_ip = HttpRequest.client_ip()
-        full_url = str(HttpRequest.url())
-        # Check for suspicious patterns
+    def _scan(self, full_url: str):
+        """
+        Scan the URL and the inspected headers for suspicious patterns
+
+        Args:
+            full_url: Full request URL
+
+        Returns:
+            Tuple of (is_suspicious, matched URL pattern, suspicious headers)
+        """
         is_suspicious = False
         matched_pattern = None
+        suspicious_headers = {}
+
+        # One pass over a newline-joined buffer (no pattern matches across a
+        # newline); each match is attributed to its segment by offset, then the
+        # scan skips to the next segment
+        scanned_headers = self.SCANNED_HEADERS
+        scanned = [
+            (header, value) for header, value in HttpRequest.get_headers()
+            if header.lower() in scanned_headers
+        ]
+        segments = [full_url]
+        segments.extend(value if type(value) is str else str(value) for _, value in scanned)
+        starts = []
+        offset = 0
+        for segment in segments:
+            starts.append(offset)
+            offset += len(segment) + 1
+        buffer = '\n'.join(segments)
 
-        if self.pattern.search(full_url):
+        # Most requests contain no trigger substring: skip the regex. Only for ASCII
+        # text, since case-insensitive matching also folds e.g. 'ı' and 'ſ' to 'i' and 's'
+        if self._triggers is not None and buffer.isascii():
+            lowered = buffer.lower()
+            if not any(trigger in lowered for trigger in self._triggers):
+                return is_suspicious, matched_pattern, suspicious_headers
+
+        pos = 0
+        while True:
+            match = self.pattern.search(buffer, pos)
+            if not match:
+                break
             is_suspicious = True
-            matched_pattern = self.pattern.search(full_url).group(0)
+            index = bisect_right(starts, match.start()) - 1
+            if index == 0:
+                matched_pattern = match.group(0)
+            else:
+                header, value = scanned[index - 1]
+                suspicious_headers[header] = value
+            if index + 1 == len(starts):
+                break
+            pos = starts[index + 1]
+
+        return is_suspicious, matched_pattern, suspicious_headers
+
+    async def after_response(self, request: Request, response):
+        """Log suspicious requests after processing"""
+        full_url = HttpRequest.url()
+        if type(full_url) is not str:
+            full_url = str(full_url)
+
+        # Check for suspicious patterns (only if the security log would record them)
+        is_suspicious = False
+        if self._security_logger.isEnabledFor(logging.WARNING):
+            is_suspicious, matched_pattern, suspicious_headers = self._scan(full_url)
+
+        # Skip building the malformed entry if the logger's level would drop it
+        is_malformed = (
+            bool(response) and response.status == 400
+            and self._malformed_logger.isEnabledFor(logging.INFO)
+        )
+        if not (is_suspicious or is_malformed):
+            return response
+
+        # Request details shared by both log entries, read once
+        client_ip = HttpRequest.client_ip()
+        method = HttpRequest.method()
+        user_agent = HttpRequest.user_agent()
 
-        # Check headers for suspicious content
-        suspicious_headers = {}
-        for header, value in HttpRequest.get_headers():
-            if header.lower() in ['host', 'user-agent', 'referer']:
-                if self.pattern.search(str(value)):
-                    is_suspicious = True
-                    suspicious_headers[header] = value
-        
         # Log suspicious requests
         if is_suspicious:
             # JSONFormatter will handle serialization, pass message and extra data
-            getLogger('security').warning(
-                f"Suspicious request detected",
+            self._security_logger.warning(
+                "Suspicious request detected",
                 extra={
                     'ip': client_ip,
-                    'method': HttpRequest.method(),
+                    'method': method,
                     'path': HttpRequest.path(),
                     'full_url': full_url,
                     'matched_pattern': matched_pattern,
                     'suspicious_headers': suspicious_headers,
-                    'user_agent': HttpRequest.user_agent(),
+                    'user_agent': user_agent,
                     'referer': HttpRequest.referer() or 'None',
                     'status_code': response.status if response else None
                 }
             )
 
         # Log malformed requests (400 errors)
-        if response and response.status == 400:
-            getLogger('malformed').info(
+        if is_malformed:
+            self._malformed_logger.info(
                 "Malformed request received",
                 extra={
                     'ip': client_ip,
-                    'method': HttpRequest.method(),
+                    'method': method,
                     'url': full_url,
-                    'user_agent': HttpRequest.user_agent(),
+                    'user_agent': user_agent,
                     'error': 'Bad Request'
                 }
             )
 
         return response
+
+
+# Compiled once at import and shared by all middleware instances
+_SUSPICIOUS_RE = _compile_patterns(SecurityLoggerMiddleware.SUSPICIOUS_PATTERNS)
@@ -3,8 +3,10 @@ from sanic import Request
 from typing import Optional
 from larasanic.helpers import view
 from larasanic.support.facades import HttpRequest
+from larasanic.support.facades.http_response import ViewResponseBuilder
 from larasanic.http import ResponseHelper
 from larasanic.support import Config
+from larasanic.defaults import DEFAULT_SPA_NON_SPA_PREFIXES
 
 class SpaMiddleware(Middleware):
     """
@@ -20,6 +22,13 @@ class SpaMiddleware(Middleware):
     - Support server-side rendering on direct access
     """
 
+    # Path prefixes that never get the SPA shell (override with spa.NON_SPA_PREFIXES)
+    NON_SPA_PREFIXES = DEFAULT_SPA_NON_SPA_PREFIXES
+
+    def __init__(self):
+        self.non_spa_prefixes = tuple(Config.get('spa.NON_SPA_PREFIXES', self.NON_SPA_PREFIXES))
+        self.spa_content_variable = Config.get('template.BLADE_VIEW_CONFIG.spa_content_variable')
+
     @classmethod
     def _register_middleware(cls) -> Optional['SpaMiddleware']:
         return cls()
@@ -28,13 +37,15 @@ class SpaMiddleware(Middleware):
         """
         Handle SPA requests with optimized header detection and SSR
         """
+        # API, WebSocket and static paths are never SPA pages
+        if HttpRequest.path().startswith(self.non_spa_prefixes):
+            return None
+
         # Check if we're already in SSR mode to prevent infinite recursion
         if HttpRequest.has('_ssr_mode'):
             return None
 
         # FAST PATH: Check dedicated SPA header (10x faster than HttpRequest.is_ajax())
-        spa_mode = HttpRequest.has_spa_header()
-
         if HttpRequest.has_spa_header():
             # SPA navigation - let route handler return partial HTML
             return None
@@ -59,7 +70,6 @@ class SpaMiddleware(Middleware):
                 result = await handler(request)
 
                 # If result is ViewResponseBuilder, render it as partial
-                from larasanic.support.facades.http_response import ViewResponseBuilder
                 if isinstance(result, ViewResponseBuilder):
                     # Build to get HTML (will render as partial based on SPA header)
                     partial_response = await result.build()
@@ -67,7 +77,7 @@ class SpaMiddleware(Middleware):
 
                     # Wrap in SPA base layout with pre-rendered content
                     return view(
-                        context={Config.get('template.BLADE_VIEW_CONFIG.spa_content_variable'): html_content}
+                        context={self.spa_content_variable: html_content}
                     )
                 else:
                     # Handler returned something else (redirect, HTTPResponse, etc)
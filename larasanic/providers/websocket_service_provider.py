@@ -29,6 +29,16 @@ class WebSocketServiceProvider(ServiceProvider):
         # Get WebSocket configuration
         ws_manager = App.make('ws_manager')
 
+        @self.app.sanic_app.before_server_start
+        async def start_ws_manager(app, loop):
+            """Start Redis pub/sub before the first connection arrives"""
+            await ws_manager.startup()
+
+        @self.app.sanic_app.after_server_stop
+        async def stop_ws_manager(app, loop):
+            """Flush pending Redis publishes and stop the pub/sub tasks"""
+            await ws_manager.shutdown()
+
         from larasanic.defaults import DEFAULT_WS_PATH
         @self.app.sanic_app.websocket(Config.get('app.WS_PATH', DEFAULT_WS_PATH))
         async def websocket_handler(request, ws):
@@ -4,14 +4,26 @@ Automatically scans and loads routes from web.py, api.py, ws.py files
 """
 import os
 import importlib.util
-from typing import Dict, List, Optional
-from larasanic.support.facades import App,Route
+from collections import defaultdict
+from functools import partial
+from itertools import islice
+from typing import Dict, Iterable, List, Optional
+from larasanic.support.facades import App,Route,HttpRequest
 from larasanic.support import Storage
 
+
+async def _request_wrapper(original_handler, sanic_request, *args, **kwargs):
+    """Replace first parameter (request) with HttpRequest facade"""
+    return await original_handler(HttpRequest, *args, **kwargs)
+
+
 class BlueprintLoader:
     """
     Loads route files and creates Sanic blueprints
     """
+    # First URI segment => blueprint name (anything else belongs to 'web')
+    _PREFIX_TO_BLUEPRINT = {'api': 'api', 'ws': 'ws'}
+
     def __init__(self,routes_dir = None):
         """
         Initialize blueprint loader
@@ -26,7 +38,7 @@ class BlueprintLoader:
             return None
 
         # Store current route count
-        routes_before = len(Route.get_routes())
+        routes_before = Route.routes.count()
 
         # Load the route file (this will register routes with Router singleton)
         spec = importlib.util.spec_from_file_location(f"routes.{blueprint_name}", file_path)
@@ -34,9 +46,7 @@ class BlueprintLoader:
         spec.loader.exec_module(module)
 
         # Get newly registered routes
-        all_routes = Route.get_routes()
-        new_routes = all_routes[routes_before:]
-
+        new_routes = Route.routes.get_since(routes_before)
 
         if not new_routes:
             return None
@@ -74,15 +84,22 @@ class BlueprintLoader:
         }
         return prefixes.get(blueprint_name)
 
-    def _organize_provider_routes(self, provider_routes: List) -> Dict[str, List]:
+    def _blueprint_for_uri(self, uri: str) -> str:
+        """
+        Get blueprint name for a URI (without leading slash) from its first segment
+        """
+        first_segment, separator, _ = uri.partition('/')
+        if not separator:
+            return 'web'
+        return self._PREFIX_TO_BLUEPRINT.get(first_segment, 'web')
+
+    def _organize_provider_routes(self, provider_routes: Iterable) -> Dict[str, List]:
         """
         Organize provider routes by blueprint based on their group name or URI prefix
         """
-        organized = {}
+        organized = defaultdict(list)
 
         for route in provider_routes:
-            blueprint_name = 'web'  # default
-
             # First, check if route has a group name prefix (from .name('api.auth.'))
             group_name = route.get_group_name_prefix()
             if group_name:
@@ -90,15 +107,9 @@ class BlueprintLoader:
                 blueprint_name = group_name.split('.')[0]
             else:
                 # Fall back to URI prefix detection
-                uri = route.get_compiled_uri()
-                if uri.startswith('api/'):
-                    blueprint_name = 'api'
-                elif uri.startswith('ws/'):
-                    blueprint_name = 'ws'
+                blueprint_name = self._blueprint_for_uri(route.get_compiled_uri())
 
             # Add route to appropriate blueprint
-            if blueprint_name not in organized:
-                organized[blueprint_name] = []
             organized[blueprint_name].append(route)
 
         return organized
@@ -108,7 +119,7 @@ class BlueprintLoader:
         Prepare all blueprints by loading route files and organizing provider routes
         """
         # Step 1: Track routes registered by providers (before loading files)
-        routes_before_files = len(Route.get_routes())
+        routes_before_files = Route.routes.count()
 
         # Step 2: Load route files
         # Order matters! API routes must be registered before web catch-all
@@ -127,9 +138,9 @@ class BlueprintLoader:
                     blueprints_info[blueprint_name] = blueprint_info
 
         # Step 3: Organize provider routes by blueprint
-        all_routes = Route.get_routes()
         if routes_before_files > 0:
-            provider_routes = all_routes[:routes_before_files]
+            # Iterate the provider routes in place rather than copying them out
+            provider_routes = islice(Route.routes, routes_before_files)
             organized_provider_routes = self._organize_provider_routes(provider_routes)
 
             # Step 4: Merge provider routes into blueprints
@@ -147,7 +158,7 @@ class BlueprintLoader:
                     }
 
                 # Prepend provider routes (so they're registered before file routes)
-                blueprints_info[blueprint_name]['routes'] = routes + blueprints_info[blueprint_name]['routes']
+                blueprints_info[blueprint_name]['routes'][:0] = routes
 
         return blueprints_info
 
@@ -176,16 +187,22 @@ class BlueprintLoader:
         route_count = 0
         sanic_app = App.get_sanic()
         registered_route_names = set()  # Track which routes we register
+        wrapped_handlers = {}  # (handler, middleware names) => middleware-wrapped handler
 
         for blueprint_name, info in self.prepare_blueprints().items():
             prefix = info['prefix'] or ''
+            bp_slash = blueprint_name + '/'
+            bp_dot = blueprint_name + '.'
 
             for route in info['routes']:
                 handler = route.get_action()
                 route_uri = route.get_compiled_uri()
+                methods = route.get_methods()
+                route_name = route.get_name()
+                route_middleware = route.get_middleware()
 
                 # Build final URI with proper prefix handling
-                if prefix and route_uri.startswith(blueprint_name + '/'):
+                if prefix and route_uri.startswith(bp_slash):
                     # Route already has prefix (e.g., provider routes)
                     uri = '/' + route_uri
                 elif prefix:
@@ -199,33 +216,28 @@ class BlueprintLoader:
                     # No prefix - use route_uri as-is or root '/'
                     uri = '/' + route_uri if route_uri else '/'
 
-                methods = route.get_methods()
-
                 # Build unique route name with blueprint prefix
-                route_name = route.get_name()
                 if route_name:
                     # Only add blueprint prefix if route name doesn't already start with it
                     # (provider routes may already have full names like 'api.auth.login')
-                    if not route_name.startswith(f"{blueprint_name}."):
-                        route_name = f"{blueprint_name}.{route_name}"
-
-                # Get route-specific middleware from .middleware() calls
-                route_middleware = route.get_middleware()
+                    if not route_name.startswith(bp_dot):
+                        route_name = bp_dot + route_name
 
+                # Route-specific middleware from .middleware() calls
                 if route_middleware:
-                    # Wrap handler with route middleware
-                    handler = registry.wrap_handler(handler, route_middleware)
+                    # Wrap handler with route middleware (once per handler + middleware stack)
+                    key = (handler, tuple(route_middleware))
+                    wrapped_handler = wrapped_handlers.get(key)
+                    if wrapped_handler is None:
+                        wrapped_handler = wrapped_handlers[key] = registry.wrap_handler(handler, route_middleware)
+                    handler = wrapped_handler
 
                 # Wrap handler to replace Sanic request with HttpRequest facade
-                # Use closure factory to avoid capturing loop variable
-                def make_wrapper(original_handler):
-                    async def request_wrapper(sanic_request, *args, **kwargs):
-                        """Replace first parameter (request) with HttpRequest facade"""
-                        from larasanic.support.facades import HttpRequest
-                        return await original_handler(HttpRequest, *args, **kwargs)
-                    return request_wrapper
-
-                handler = make_wrapper(handler)
+                # (one shared coroutine function bound per route, no per-route closure)
+                wrapped = handler
+                handler = partial(_request_wrapper, wrapped)
+                # Sanic falls back to __name__ for unnamed routes
+                handler.__name__ = getattr(wrapped, '__name__', _request_wrapper.__name__)
 
                 # Register handler with Sanic
                 sanic_app.add_route(
@@ -241,9 +253,9 @@ class BlueprintLoader:
         # Import Sanic-only routes (like static files) into our Route collection
         # This ensures all routes are centralized in one place
         # Only routes NOT already in our collection will be added
-        self._import_sanic_routes(registered_route_names)
-        # Refresh route collection indexes after all routes are loaded
-        Route.routes.refresh_name_lookups()
+        # Route collection indexes are refreshed once, when the bulk insert ends
+        with Route.routes.bulk_insert():
+            self._import_sanic_routes(registered_route_names)
 
     def _import_sanic_routes(self, registered_route_names: set):
         """
@@ -253,22 +265,28 @@ class BlueprintLoader:
         from larasanic.routing.route import Route as RouteClass
         from larasanic.support import Config,Str
         sanic_routes = App.get_sanic().router.routes
+        app_prefix = f"{Str.snake(Config.get('app.app_name'))}."
 
-        for sanic_route in sanic_routes:
-            # Skip if route already exists in our collection
-            route_name = sanic_route.name.replace(f"{Str.snake(Config.get('app.app_name'))}.", '') if hasattr(sanic_route, 'name') else None
+        # Names registered by us or already in our collection
+        known_names = set(registered_route_names)
+        known_names.update(Route.routes.names())
 
-            # Skip routes that we registered ourselves
-            if route_name and route_name in registered_route_names:
-                continue
+        for sanic_route in sanic_routes:
+            route_name = getattr(sanic_route, 'name', None)
+            if route_name:
+                route_name = route_name.removeprefix(app_prefix)
 
-            if route_name and Route.routes.has_named_route(route_name):
+            # Skip routes that we registered ourselves or that already exist in our collection
+            if route_name and route_name in known_names:
                 continue
 
             # Create our Route object from Sanic route
-            methods = list(sanic_route.methods) if hasattr(sanic_route, 'methods') else ['GET']
-            uri = sanic_route.uri if hasattr(sanic_route, 'uri') else sanic_route.path
-            handler = sanic_route.handler if hasattr(sanic_route, 'handler') else None
+            methods = getattr(sanic_route, 'methods', None)
+            methods = list(methods) if methods is not None else ['GET']
+            uri = getattr(sanic_route, 'uri', None)
+            if uri is None:
+                uri = sanic_route.path
+            handler = getattr(sanic_route, 'handler', None)
             handler_name = getattr(handler, '__name__', '') if handler else None
             # Create route object
             route = RouteClass(methods, uri, handler)
@@ -276,17 +294,16 @@ class BlueprintLoader:
             # Set name if exists
             if route_name:
                 route._name = route_name
+                known_names.add(route_name)
 
             # Check if handler is a static file handler
             if handler and handler_name and handler_name == '_static_request_handler':
                 blueprint_name = 'static'
+            elif uri.startswith('/'):
+                # Fallback to URI-based detection
+                blueprint_name = self._blueprint_for_uri(uri[1:])
             else:
                 blueprint_name = 'web'  # default
-                # Fallback to URI-based detection
-                if uri.startswith('/api/'):
-                    blueprint_name = 'api'
-                elif uri.startswith('/ws/'):
-                    blueprint_name = 'ws'
             route.set_blueprint(blueprint_name)
 
             # Add to our collection
@@ -2,8 +2,34 @@
 Route Class
 Represents a single route with fluent API (Laravel-style)
 """
-from typing import Union, List, Dict, Optional, Callable, Any
+from typing import Union, List, Dict, Optional, Callable, Any, Tuple
 import re
+import sys
+
+# Canonical (interned) HTTP method strings: uppercase input maps to itself without .upper()
+_METHODS = {m: sys.intern(m) for m in ('GET', 'POST', 'PUT', 'PATCH', 'DELETE', 'OPTIONS', 'HEAD')}
+
+# Laravel-style {param} / {param?} placeholders
+_PARAM_RE = re.compile(r'\{(\w+)\??}')
+
+# Either placeholder style ({param} / {param?} or Sanic's <param> / <param:type>), for matching
+_MATCH_PARAM_RE = re.compile(r'\{(\w+)\??}|<(\w+):?(?:\w+)?>')
+
+
+def _named_param_group(match: re.Match) -> str:
+    """Regex group for a placeholder matched by _MATCH_PARAM_RE"""
+    return f"(?P<{match.group(1) or match.group(2)}>[^/]+)"
+
+
+# Common where() constraints => Sanic parameter types
+_CONSTRAINT_TO_SANIC = {
+    r'[0-9]+': 'int',
+    r'[a-zA-Z0-9\-]+': 'slug',
+    r'.*': 'path',
+}
+
+# Blueprint name => URI prefix added by get_uri()
+_BLUEPRINT_PREFIXES = {'api': 'api', 'ws': 'ws'}
 
 
 class Route:
@@ -15,6 +41,14 @@ class Route:
         route.name('users.show').where('id', '[0-9]+').middleware(['auth'])
     """
 
+    # Fixed attribute layout: slot access instead of per-instance dicts
+    __slots__ = (
+        'methods', 'uri', 'action', '_name', '_middleware', '_wheres', '_defaults',
+        '_domain', '_prefix', '_namespace', '_as', '_group_name_prefix', '_controller',
+        '_action_name', '_action_name_full', '_cached_uri', '_compiled_uri', '_match_re', '_parameter_names',
+        '_blueprint', '_is_fallback', '_options',
+    )
+
     def __init__(
         self,
         methods: List[str],
@@ -31,7 +65,7 @@ class Route:
             action: Handler function, controller string, or action dict
             **options: Additional route options
         """
-        self.methods = [m.upper() for m in methods]
+        self.methods = tuple(_METHODS.get(m) or sys.intern(m.upper()) for m in methods)
         self.uri = uri.strip('/')
         self.action = action
         self._name: Optional[str] = None
@@ -44,9 +78,12 @@ class Route:
         self._as: Optional[str] = None  # Not used - kept for potential future use
         self._group_name_prefix: Optional[str] = None  # Store group's 'as' attribute
         self._controller: Optional[str] = None
+        self._cached_uri: Optional[str] = None
         self._compiled_uri: Optional[str] = None
-        self._parameter_names: List[str] = []
+        self._match_re: Optional[re.Pattern] = None
+        self._parameter_names: Tuple[str, ...] = ()
         self._blueprint: Optional[str] = None  # Store blueprint name (web, api, ws)
+        self._is_fallback: bool = False  # Set by Router.fallback()
 
         # Store additional options
         self._options = options
@@ -62,14 +99,22 @@ class Route:
         else:
             self._action_name = getattr(action, '__name__', 'Closure')
 
+        # Display action name (controller@method), fixed once the action is known
+        self._action_name_full = f"{self._controller}@{self._action_name}" if self._controller else self._action_name
+
         # Parse parameters from URI
         self._parse_parameters()
 
+    def _invalidate(self):
+        """Clear the URI-derived caches after the prefix, blueprint or constraints change"""
+        self._cached_uri = None
+        self._compiled_uri = None
+        self._match_re = None
+
     def _parse_parameters(self):
         """Extract parameter names from URI pattern"""
         # Match {param} and {param?}
-        pattern = r'\{(\w+)\??}'
-        self._parameter_names = re.findall(pattern, self.uri)
+        self._parameter_names = tuple(_PARAM_RE.findall(self.uri))
 
     def name(self, name: str) -> 'Route':
         """
@@ -122,6 +167,7 @@ class Route:
             self._wheres.update(parameter)
         elif pattern is not None:
             self._wheres[parameter] = pattern
+        self._invalidate()
         return self
 
     def whereNumber(self, parameter: str) -> 'Route':
@@ -193,6 +239,7 @@ class Route:
             self._prefix = f"{self._prefix}/{prefix}"
         else:
             self._prefix = prefix
+        self._invalidate()
         return self
 
     def get_prefix(self) -> Optional[str]:
@@ -212,13 +259,12 @@ class Route:
         if not self._blueprint:
             return self._prefix
 
-        # Split prefix by '/'
-        parts = self._prefix.split('/')
+        # Split off the first prefix segment
+        head, _, tail = self._prefix.partition('/')
 
         # If first part matches blueprint, remove it
-        if parts[0] == self._blueprint:
-            remaining = '/'.join(parts[1:])
-            return remaining if remaining else None
+        if head == self._blueprint:
+            return tail or None
 
         return self._prefix
     
@@ -232,12 +278,13 @@ class Route:
 
     def get_action_name(self) -> str:
         """Get the action name (for display)"""
-        if self._controller:
-            return f"{self._controller}@{self._action_name}"
-        return self._action_name
+        return self._action_name_full
 
     def get_uri(self) -> str:
         """Get the full URI with prefix and blueprint prefix"""
+        if self._cached_uri is not None:
+            return self._cached_uri
+
         # Build URI from prefix + uri
         if self._prefix:
             uri = f"{self._prefix}/{self.uri}".strip('/')
@@ -246,11 +293,11 @@ class Route:
 
         # Add blueprint prefix if exists (and not already present)
         if self._blueprint:
-            blueprint_prefixes = {'api': 'api', 'ws': 'ws'}
-            blueprint_prefix = blueprint_prefixes.get(self._blueprint)
+            blueprint_prefix = _BLUEPRINT_PREFIXES.get(self._blueprint)
             if blueprint_prefix and not uri.startswith(f"{blueprint_prefix}/"):
                 uri = f"{blueprint_prefix}/{uri}".strip('/')
 
+        self._cached_uri = uri
         return uri
 
     def get_compiled_uri(self) -> str:
@@ -274,21 +321,17 @@ class Route:
                 constraint = self._wheres[param_name]
 
                 # Map common constraints to Sanic types
-                if constraint == r'[0-9]+':
-                    param_type = 'int'
-                elif constraint.startswith(r'[0-9a-fA-F]{8}'):  # UUID
-                    param_type = 'uuid'
-                elif constraint == r'[a-zA-Z0-9\-]+':
-                    param_type = 'slug'
-                elif constraint == r'.*':
-                    param_type = 'path'
-                else:
-                    # For custom regex, use Sanic's regex format: <name:ymd>
-                    # where ymd is defined in app.router.regex()
-                    # Since we can't dynamically register regex patterns,
-                    # we'll just use 'str' and warn about the limitation
-                    param_type = 'str'
-                    # TODO: Add custom regex support via Sanic's regex() method
+                param_type = _CONSTRAINT_TO_SANIC.get(constraint)
+                if param_type is None:
+                    if constraint.startswith(r'[0-9a-fA-F]{8}'):  # UUID
+                        param_type = 'uuid'
+                    else:
+                        # For custom regex, use Sanic's regex format: <name:ymd>
+                        # where ymd is defined in app.router.regex()
+                        # Since we can't dynamically register regex patterns,
+                        # we'll just use 'str' and warn about the limitation
+                        param_type = 'str'
+                        # TODO: Add custom regex support via Sanic's regex() method
             else:
                 # Default to string type
                 param_type = 'str'
@@ -300,14 +343,14 @@ class Route:
                 return f"<{param_name}:{param_type}>"
 
         # Replace {param} and {param?} patterns
-        self._compiled_uri = re.sub(r'\{(\w+)\??}', convert_param, uri)
+        self._compiled_uri = _PARAM_RE.sub(convert_param, uri)
         return self._compiled_uri
 
     def get_middleware(self) -> List[str]:
         """Get route middleware"""
         return self._middleware
 
-    def get_methods(self) -> List[str]:
+    def get_methods(self) -> Tuple[str, ...]:
         """Get HTTP methods"""
         return self.methods
 
@@ -315,7 +358,7 @@ class Route:
         """Get route action"""
         return self.action
 
-    def get_parameter_names(self) -> List[str]:
+    def get_parameter_names(self) -> Tuple[str, ...]:
         """Get parameter names from URI"""
         return self._parameter_names
 
@@ -346,6 +389,7 @@ class Route:
             Self for method chaining
         """
         self._blueprint = blueprint
+        self._invalidate()
         return self
 
     def has_parameters(self) -> bool:
@@ -367,16 +411,16 @@ class Route:
         Returns:
             True if route matches
         """
-        if method.upper() not in self.methods:
+        if (_METHODS.get(method) or method.upper()) not in self.methods:
             return False
 
         # Simple pattern matching (Sanic handles the actual routing)
-        pattern = self.get_compiled_uri()
-        # Convert Sanic pattern to regex for matching
-        regex_pattern = re.sub(r'<(\w+):?(\w+)?>', r'(?P<\1>[^/]+)', pattern)
-        regex_pattern = '^' + regex_pattern + '$'
+        if self._match_re is None:
+            # Convert placeholders straight to regex groups (compiled once per route)
+            regex_pattern = _MATCH_PARAM_RE.sub(_named_param_group, self.get_uri())
+            self._match_re = re.compile('^' + regex_pattern + '$')
 
-        return re.match(regex_pattern, uri.strip('/')) is not None
+        return self._match_re.match(uri.strip('/')) is not None
 
     def bind(self, request):
         """
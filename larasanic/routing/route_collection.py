@@ -2,8 +2,10 @@
 Route Collection
 Manages a collection of routes with lookup capabilities
 """
-from typing import Dict, List, Optional
-from larasanic.routing.route import Route
+import re
+from contextlib import contextmanager
+from typing import Dict, Iterator, KeysView, List, Optional, Tuple
+from larasanic.routing.route import Route, _MATCH_PARAM_RE, _METHODS
 
 
 class RouteCollection:
@@ -27,6 +29,10 @@ class RouteCollection:
             'HEAD': []
         }
         self._all_routes: Dict[str, Route] = {}
+        self._routes_by_action: Dict[str, Route] = {}
+        # Per-method combined match regex (built lazily by match(), None if it can't compile)
+        self._compiled_by_method: Dict[str, Tuple[Optional[re.Pattern], Tuple[Route, ...]]] = {}
+        self._bulk_inserting = False
 
     def add(self, route: Route) -> Route:
         """
@@ -42,28 +48,53 @@ class RouteCollection:
         # Sanic will handle actual duplicate route registration
         self._routes.append(route)
 
-        # Index by name if route has one
-        if route.get_name():
-            # Check for duplicate names
-            if route.get_name() in self._routes_by_name:
-                existing = self._routes_by_name[route.get_name()]
-                print(f"⚠️  Duplicate route name: {route.get_name()}")
-                print(f"    Existing URI: {existing.get_uri()}")
-                print(f"    New URI: {route.get_uri()}")
-            self._routes_by_name[route.get_name()] = route
-
-        # Index by methods
-        for method in route.get_methods():
-            if method in self._routes_by_method:
-                self._routes_by_method[method].append(route)
+        # Index by action (first route registered for an action wins)
+        self._routes_by_action.setdefault(route.get_action_name(), route)
 
-        # Index by URI + method combination (for fast lookup)
+        # Index by URI + method combination (for fast lookup) and by method in one pass;
+        # the method index is rebuilt once when a bulk insert ends
+        uri = route.get_uri()
+        incremental = not self._bulk_inserting
         for method in route.get_methods():
-            key = f"{method}:{route.get_uri()}"
-            self._all_routes[key] = route
+            self._all_routes[f"{method}:{uri}"] = route
+            if incremental and method in self._routes_by_method:
+                self._routes_by_method[method].append(route)
+                self._compiled_by_method.pop(method, None)
+
+        # The name index is likewise rebuilt once when a bulk insert ends
+        name = route.get_name()
+        if name and incremental:
+            # Check for duplicate names (stripped under python -O)
+            if __debug__:
+                existing = self._routes_by_name.get(name)
+                if existing is not None:
+                    print(f"⚠️  Duplicate route name: {name}")
+                    print(f"    Existing URI: {existing.get_uri()}")
+                    print(f"    New URI: {uri}")
+            self._routes_by_name[name] = route
 
         return route
 
+    @contextmanager
+    def bulk_insert(self) -> Iterator['RouteCollection']:
+        """
+        Add many routes, rebuilding the name and method indexes once at the end
+
+        Duplicate-name warnings are not printed for routes added in bulk.
+
+        Example:
+            with collection.bulk_insert():
+                for route in routes:
+                    collection.add(route)
+        """
+        self._bulk_inserting = True
+        try:
+            yield self
+        finally:
+            self._bulk_inserting = False
+            self.refresh_name_lookups()
+            self.refresh_method_lookups()
+
     def get_by_name(self, name: str) -> Optional[Route]:
         """
         Get route by name
@@ -98,10 +129,7 @@ class RouteCollection:
         Returns:
             Route instance or None
         """
-        for route in self._routes:
-            if route.get_action_name() == action:
-                return route
-        return None
+        return self._routes_by_action.get(action)
 
     def match(self, uri: str, method: str) -> Optional[Route]:
         """
@@ -114,18 +142,55 @@ class RouteCollection:
         Returns:
             Matching route or None
         """
+        method = _METHODS.get(method) or method.upper()
+
         # Try exact match first (fast path)
-        key = f"{method.upper()}:{uri.strip('/')}"
-        if key in self._all_routes:
-            return self._all_routes[key]
+        route = self._all_routes.get(f"{method}:{uri.strip('/')}")
+        if route is not None:
+            return route
 
-        # Try pattern matching (slower path)
-        for route in self.get_by_method(method):
+        # Try pattern matching (slower path): one combined regex per method
+        pattern, routes = self._get_method_matcher(method)
+        if pattern is not None:
+            match = pattern.match(uri.strip('/'))
+            return routes[int(match.lastgroup[2:])] if match else None
+
+        for route in routes:
             if route.matches(uri, method):
                 return route
 
         return None
 
+    def _get_method_matcher(self, method: str) -> Tuple[Optional[re.Pattern], Tuple[Route, ...]]:
+        """
+        Get the combined match regex for a method's routes
+
+        Each route becomes one alternative, (?P<_r{index}>...$), tried in registration
+        order, so match.lastgroup identifies the first route that matches.
+
+        Args:
+            method: Uppercase HTTP method
+
+        Returns:
+            Tuple of (compiled regex or None, routes); None means match one route at a time
+        """
+        matcher = self._compiled_by_method.get(method)
+        if matcher is None:
+            routes = tuple(self._routes_by_method.get(method, ()))
+            pattern = None
+            if routes:
+                source = '|'.join(
+                    f"(?P<_r{index}>{_MATCH_PARAM_RE.sub('[^/]+', route.get_uri())}$)"
+                    for index, route in enumerate(routes)
+                )
+                try:
+                    pattern = re.compile(source)
+                except re.error:
+                    # A route URI holding regex syntax that can't be combined
+                    pattern = None
+            matcher = self._compiled_by_method[method] = (pattern, routes)
+        return matcher
+
     def get_routes(self) -> List[Route]:
         """Get all routes"""
         return self._routes
@@ -146,10 +211,26 @@ class RouteCollection:
         """Check if a named route exists"""
         return name in self._routes_by_name
 
+    def names(self) -> KeysView[str]:
+        """Get the names of all named routes (live view)"""
+        return self._routes_by_name.keys()
+
     def count(self) -> int:
         """Get total number of routes"""
         return len(self._routes)
 
+    def get_since(self, index: int) -> List[Route]:
+        """
+        Get routes added after the collection held `index` routes
+
+        Args:
+            index: Route count snapshot (from count())
+
+        Returns:
+            List of routes added since the snapshot
+        """
+        return self._routes[index:]
+
     def refresh_name_lookups(self):
         """Refresh the name-based lookup index"""
         self._routes_by_name.clear()
@@ -159,6 +240,7 @@ class RouteCollection:
 
     def refresh_method_lookups(self):
         """Refresh the method-based lookup index"""
+        self._compiled_by_method.clear()
         for method in self._routes_by_method:
             self._routes_by_method[method] = []
 
@@ -172,6 +254,8 @@ class RouteCollection:
         self._routes.clear()
         self._routes_by_name.clear()
         self._all_routes.clear()
+        self._routes_by_action.clear()
+        self._compiled_by_method.clear()
         for method in self._routes_by_method:
             self._routes_by_method[method] = []
 
@@ -398,6 +398,6 @@ def validate_all_configs() -> Dict[str, ConfigValidator]:
         from larasanic.logging import getLogger
         logger = getLogger('config_validator')
         for warning in all_warnings:
-            logger.warning(f"Config warning: {warning}")
+            logger.warning("Config warning: %s", warning)
 
     return validators
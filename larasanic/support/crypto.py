@@ -312,23 +312,23 @@ class Crypto:
             SecurityError: If private key has insecure permissions
             FileNotFoundError: If key file doesn't exist
         """
-        if not key_path.exists():
-            raise FileNotFoundError(f"Key file not found: {key_path}")
-
-        # Check permissions for private keys
-        if is_private:
-            stat_info = key_path.stat()
-            file_mode = stat_info.st_mode
-
-            # Check if group or others have any permissions (should be 600)
-            if file_mode & (stat.S_IRWXG | stat.S_IRWXO):
-                current_perms = oct(file_mode & 0o777)
-                raise SecurityError(
-                    f"Private key {key_path} has insecure permissions ({current_perms}). "
-                    f"Fix with: chmod 600 {key_path}"
-                )
-
-        return key_path.read_text()
+        # A missing file surfaces from stat()/read_text() (no separate exists() check)
+        try:
+            # Check permissions for private keys
+            if is_private:
+                file_mode = key_path.stat().st_mode
+
+                # Check if group or others have any permissions (should be 600)
+                if file_mode & (stat.S_IRWXG | stat.S_IRWXO):
+                    current_perms = oct(file_mode & 0o777)
+                    raise SecurityError(
+                        f"Private key {key_path} has insecure permissions ({current_perms}). "
+                        f"Fix with: chmod 600 {key_path}"
+                    )
+
+            return key_path.read_text()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Key file not found: {key_path}") from None
 
     # === Random Token Generation ===
 
@@ -354,8 +354,12 @@ class ViewResponseBuilder(ResponseBuilder):
         engine = ViewEngine(self.template, self.context)
         html_content = await engine.render()
 
-        # Set rendered HTML as content
-        self._content = html_content
+        if isinstance(html_content, bytes):
+            # Pre-serialized JSON (SPA request without a template)
+            self._content = raw(html_content, status=self._status, content_type='application/json')
+        else:
+            # Set rendered HTML as content
+            self._content = html_content
 
         # Use parent's build() to create HTTPResponse with merged cookies/headers
         return super().build()
@@ -515,8 +519,13 @@ class HttpResponse(Facade):
         Example:
             HttpResponse.headers({'X-RateLimit': '100', 'X-Token': 'xyz'})
         """
-        for key, value in headers.items():
-            cls.header(key, value)
+        ctx = cls.get_facade_root()
+
+        # Initialize headers dict if not exists
+        if not hasattr(ctx, '_response_headers'):
+            ctx._response_headers = {}
+
+        ctx._response_headers.update(headers)
 
     @classmethod
     def get_queued_headers(cls) -> Dict[str, str]:
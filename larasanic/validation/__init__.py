@@ -6,17 +6,13 @@ from larasanic.validation.validator import Validator, validate
 from larasanic.validation.validate_app import ValidateApp
 from larasanic.validation.exceptions import ValidationException
 from larasanic.validation.form_request import FormRequest
+from larasanic.validation.rules_batch import validate_batch
 from larasanic.validation.rules import (
     ValidationRule,
     Required, Email, Min, Max, String, Integer, Numeric, Boolean,
     Regex, In, NotIn, Confirmed, Same, Different, Url, Date,
     Alpha, AlphaNum, AlphaDash, Array, Json
 )
-from larasanic.validation.database_rules import Unique, Exists
-from larasanic.validation.file_rules import (
-    File, Image, Mimes, MimeTypes,
-    MaxFileSize, MinFileSize, Dimensions
-)
 # Import helpers
 from larasanic.validation.helpers import (
     quick_validate, check_validation, validate_field,
@@ -29,6 +25,7 @@ __all__ = [
     # Core
     'Validator',
     'validate',
+    'validate_batch',
     'ValidationException',
     'FormRequest',
     'ValidateApp',
@@ -81,3 +78,25 @@ __all__ = [
     'validate_date_range',
     'validate_search_query',
 ]
+
+# Database and file rules are imported on first access (keeps cold start light)
+_LAZY_RULES = {
+    'Unique': 'larasanic.validation.database_rules',
+    'Exists': 'larasanic.validation.database_rules',
+    'File': 'larasanic.validation.file_rules',
+    'Image': 'larasanic.validation.file_rules',
+    'Mimes': 'larasanic.validation.file_rules',
+    'MimeTypes': 'larasanic.validation.file_rules',
+    'MaxFileSize': 'larasanic.validation.file_rules',
+    'MinFileSize': 'larasanic.validation.file_rules',
+    'Dimensions': 'larasanic.validation.file_rules',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_RULES:
+        import importlib
+        value = getattr(importlib.import_module(_LAZY_RULES[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,7 +3,7 @@ Database Validation Rules
 Rules that interact with the database (unique, exists)
 """
 from typing import Any, Optional
-from larasanic.validation.rules import ValidationRule
+from larasanic.validation.rules import ValidationRule, _empty
 from larasanic.support.facades import App
 
 
@@ -17,8 +17,10 @@ class Unique(ValidationRule):
         'email': 'unique:users,email,id,5'     # Ignore ID 5 (for updates)
     """
 
+    __slots__ = ()
+
     async def validate(self, field: str, value: Any, data: dict) -> tuple[bool, Optional[str]]:
-        if value is None or value == '':
+        if _empty(value):
             return True, None
 
         # Parse parameters: table, column (optional), except_column (optional), except_value (optional)
@@ -71,8 +73,10 @@ class Exists(ValidationRule):
         'category_id': 'exists:categories'  # Assumes field name matches column
     """
 
+    __slots__ = ()
+
     async def validate(self, field: str, value: Any, data: dict) -> tuple[bool, Optional[str]]:
-        if value is None or value == '':
+        if _empty(value):
             return True, None
 
         # Parse parameters: table, column (optional)
@@ -0,0 +1,109 @@
+"""
+Validation Fields
+Field value lookup, display names and custom messages shared by the validators
+"""
+from functools import lru_cache
+from typing import Dict, Any, Optional
+
+
+@lru_cache(maxsize=1024)
+def compile_field_trie(fields: tuple) -> dict:
+    """
+    Build a trie over dot-notation field names
+
+    Args:
+        fields: Field names (e.g., ('user.email', 'user.name', 'age'))
+
+    Returns:
+        Nested dict of key => (field or None, children)
+    """
+    trie = {}
+    for field in fields:
+        keys = field.split('.')
+        node = trie
+        for index, key in enumerate(keys):
+            entry = node.get(key)
+            if entry is None:
+                entry = node[key] = [None, {}]
+            if index == len(keys) - 1:
+                entry[0] = field
+            node = entry[1]
+    return trie
+
+
+def resolve_field_values(data: Dict[str, Any], fields: tuple) -> Dict[str, Any]:
+    """
+    Resolve dot-notation fields in one walk of the data
+
+    Fields sharing a prefix (user.profile.email, user.profile.name) share the
+    lookups for that prefix.
+
+    Args:
+        data: Data to read from
+        fields: Field names (e.g., ('user.email', 'user.name', 'age'))
+
+    Returns:
+        Dictionary of field => value (None where the path is missing)
+    """
+    values = {}
+    stack = [(compile_field_trie(fields), data)]
+
+    while stack:
+        node, current = stack.pop()
+        for key, (field, children) in node.items():
+            value = current.get(key) if isinstance(current, dict) else None
+            if field is not None:
+                values[field] = value
+            if children:
+                stack.append((children, value))
+
+    return values
+
+
+def display_name(field: str, custom_attributes: Dict[str, str]) -> str:
+    """
+    Get the name a field goes by in error messages
+
+    Args:
+        field: Field name
+        custom_attributes: Custom field names (field => display name)
+
+    Returns:
+        Display name (underscores become spaces by default)
+    """
+    return custom_attributes.get(field, field.replace('_', ' '))
+
+
+def index_messages(messages: Dict[str, str]) -> Dict[tuple, str]:
+    """
+    Index custom messages by (field, rule_name)
+
+    Args:
+        messages: Custom error messages (field.rule or rule => message)
+
+    Returns:
+        Dictionary of (field, rule_name) => message, with field None for rule-wide messages
+    """
+    index = {}
+    for key, message in messages.items():
+        index[(None, key)] = message
+        if '.' in key:
+            # Rule names never contain dots, field names may (user.email.required)
+            field, rule_name = key.rsplit('.', 1)
+            index[(field, rule_name)] = message
+    return index
+
+
+def custom_message(message_index: Dict[tuple, str], field: str, rule_name: str) -> Optional[str]:
+    """
+    Find the custom message for a failed rule (field.rule wins over rule)
+
+    Args:
+        message_index: Messages indexed by index_messages()
+        field: Field name
+        rule_name: Rule name
+
+    Returns:
+        Custom message or None
+    """
+    return message_index.get((field, rule_name)) or message_index.get((None, rule_name))
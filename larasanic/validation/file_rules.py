@@ -3,7 +3,7 @@ File Validation Rules
 Rules for validating uploaded files
 """
 from typing import Any, Optional
-from larasanic.validation.rules import ValidationRule
+from larasanic.validation.rules import ValidationRule, _empty
 import mimetypes
 import os
 
@@ -11,8 +11,10 @@ import os
 class File(ValidationRule):
     """Field must be a file upload"""
 
+    __slots__ = ()
+
     async def validate(self, field: str, value: Any, data: dict) -> tuple[bool, Optional[str]]:
-        if value is None or value == '':
+        if _empty(value):
             return True, None
 
         # Check if it's a Sanic File object
@@ -28,10 +30,12 @@ class File(ValidationRule):
 class Image(ValidationRule):
     """Field must be an image file"""
 
+    __slots__ = ()
+
     IMAGE_MIMES = {'image/jpeg', 'image/png', 'image/gif', 'image/bmp', 'image/svg+xml', 'image/webp'}
 
     async def validate(self, field: str, value: Any, data: dict) -> tuple[bool, Optional[str]]:
-        if value is None or value == '':
+        if _empty(value):
             return True, None
 
         # Check if it's a file
@@ -58,8 +62,10 @@ class Mimes(ValidationRule):
         'document': 'mimes:pdf,doc,docx'
     """
 
+    __slots__ = ()
+
     async def validate(self, field: str, value: Any, data: dict) -> tuple[bool, Optional[str]]:
-        if value is None or value == '':
+        if _empty(value):
             return True, None
 
         # Check if it's a file
@@ -91,8 +97,10 @@ class MimeTypes(ValidationRule):
         'file': 'mimetypes:application/pdf,image/jpeg'
     """
 
+    __slots__ = ()
+
     async def validate(self, field: str, value: Any, data: dict) -> tuple[bool, Optional[str]]:
-        if value is None or value == '':
+        if _empty(value):
             return True, None
 
         # Check if it's a file
@@ -123,8 +131,10 @@ class MaxFileSize(ValidationRule):
         'file': 'max_file_size:2048'  # 2MB max
     """
 
+    __slots__ = ()
+
     async def validate(self, field: str, value: Any, data: dict) -> tuple[bool, Optional[str]]:
-        if value is None or value == '':
+        if _empty(value):
             return True, None
 
         # Check if it's a file
@@ -155,8 +165,10 @@ class MinFileSize(ValidationRule):
         'file': 'min_file_size:100'  # 100KB min
     """
 
+    __slots__ = ()
+
     async def validate(self, field: str, value: Any, data: dict) -> tuple[bool, Optional[str]]:
-        if value is None or value == '':
+        if _empty(value):
             return True, None
 
         # Check if it's a file
@@ -187,8 +199,10 @@ class Dimensions(ValidationRule):
         'image': 'dimensions:min_width=100,max_width=1000,min_height=100,max_height=1000'
     """
 
+    __slots__ = ()
+
     async def validate(self, field: str, value: Any, data: dict) -> tuple[bool, Optional[str]]:
-        if value is None or value == '':
+        if _empty(value):
             return True, None
 
         # Check if it's a file
@@ -2,15 +2,52 @@
 Validation Rules
 Built-in validation rules (Laravel-style)
 """
+import importlib
 import re
+import string
+from json import loads as _json_loads, JSONDecodeError as _JSONDecodeError
 from typing import Any, Optional, List
 from datetime import datetime
-import mimetypes
+from ipaddress import ip_address
+from urllib.parse import urlsplit
+
+# Character table for alpha_dash (ASCII letters, digits, dash, underscore)
+_ALPHA_DASH_CHARS = frozenset(string.ascii_letters + string.digits + '-_')
+
+# Accepted string forms for boolean fields
+_BOOL_STRS = frozenset(('true', 'false', '1', '0', 'yes', 'no'))
+
+# URL host parts: domain labels start and end alphanumeric, the TLD is letters only
+_URL_LABEL_RE = re.compile(r'[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?')
+_URL_TLD_RE = re.compile(r'[a-z]{2,63}')
+_URL_SCHEMES = ('http', 'https')
+_WHITESPACE_RE = re.compile(r'\s')
+
+# Common date layouts: Y-m-d, Y/m/d, d-m-Y, d/m/Y (one scan picks the layout)
+_DATE_RE = re.compile(
+    r'(?P<y1>\d{4})(?P<s1>[-/])(?P<m1>\d{1,2})(?P=s1)(?P<d1>\d{1,2})'
+    r'|(?P<d2>\d{1,2})(?P<s2>[-/])(?P<m2>\d{1,2})(?P=s2)(?P<y2>\d{4})'
+)
+
+# Decimal / scientific notation accepted by the numeric rule
+_NUMERIC_RE = re.compile(r'\s*[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?\s*')
+
+
+def _empty(value: Any) -> bool:
+    """Check if a value is missing (None or empty string) without a rich compare"""
+    return value is None or (type(value) is str and not value)
 
 
 class ValidationRule:
     """Base class for validation rules"""
 
+    __slots__ = ('parameters',)
+
+    # Properties that hold for the value once this rule has passed
+    GUARANTEES: frozenset = frozenset()
+    # Property this rule only checks for (rule is redundant once guaranteed)
+    TYPE_CHECK: Optional[str] = None
+
     def __init__(self, *args):
         """Initialize rule with parameters"""
         self.parameters = args
@@ -45,10 +82,18 @@ class ValidationRule:
 class Required(ValidationRule):
     """Field is required"""
 
+    __slots__ = ()
+
+    GUARANTEES = frozenset(('nonempty',))
+
+    @staticmethod
+    def passes(value: Any) -> bool:
+        return not (_empty(value) or (isinstance(value, (list, dict)) and len(value) == 0))
+
     async def validate(self, field: str, value: Any, data: dict) -> tuple[bool, Optional[str]]:
-        if value is None or value == '' or (isinstance(value, (list, dict)) and len(value) == 0):
-            return False, self.message(field)
-        return True, None
+        if self.passes(value):
+            return True, None
+        return False, self.message(field)
 
     def message(self, field: str) -> str:
         return f"The {field} field is required."
@@ -57,10 +102,14 @@ class Required(ValidationRule):
 class Email(ValidationRule):
     """Field must be a valid email"""
 
+    __slots__ = ()
+
+    GUARANTEES = frozenset(('str',))
+
     EMAIL_REGEX = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
 
     async def validate(self, field: str, value: Any, data: dict) -> tuple[bool, Optional[str]]:
-        if value is None or value == '':
+        if _empty(value):
             return True, None  # Use 'required' rule for required fields
 
         if not isinstance(value, str):
@@ -78,8 +127,10 @@ class Email(ValidationRule):
 class Min(ValidationRule):
     """Field must be at least N (string length or numeric value)"""
 
+    __slots__ = ()
+
     async def validate(self, field: str, value: Any, data: dict) -> tuple[bool, Optional[str]]:
-        if value is None or value == '':
+        if _empty(value):
             return True, None
 
         min_val = self.parameters[0]
@@ -106,8 +157,10 @@ class Min(ValidationRule):
 class Max(ValidationRule):
     """Field must be at most N (string length or numeric value)"""
 
+    __slots__ = ()
+
     async def validate(self, field: str, value: Any, data: dict) -> tuple[bool, Optional[str]]:
-        if value is None or value == '':
+        if _empty(value):
             return True, None
 
         max_val = self.parameters[0]
@@ -134,14 +187,19 @@ class Max(ValidationRule):
 class String(ValidationRule):
     """Field must be a string"""
 
-    async def validate(self, field: str, value: Any, data: dict) -> tuple[bool, Optional[str]]:
-        if value is None or value == '':
-            return True, None
+    __slots__ = ()
 
-        if not isinstance(value, str):
-            return False, self.message(field)
+    GUARANTEES = frozenset(('str',))
+    TYPE_CHECK = 'str'
 
-        return True, None
+    @staticmethod
+    def passes(value: Any) -> bool:
+        return value is None or isinstance(value, str)
+
+    async def validate(self, field: str, value: Any, data: dict) -> tuple[bool, Optional[str]]:
+        if self.passes(value):
+            return True, None
+        return False, self.message(field)
 
     def message(self, field: str) -> str:
         return f"The {field} must be a string."
@@ -150,23 +208,33 @@ class String(ValidationRule):
 class Integer(ValidationRule):
     """Field must be an integer"""
 
-    async def validate(self, field: str, value: Any, data: dict) -> tuple[bool, Optional[str]]:
-        if value is None or value == '':
-            return True, None
+    __slots__ = ()
+
+    GUARANTEES = frozenset(('integer', 'numeric'))
+    TYPE_CHECK = 'integer'
+
+    @staticmethod
+    def passes(value: Any) -> bool:
+        if _empty(value):
+            return True
 
         if isinstance(value, bool):
-            return False, self.message(field)
+            return False
 
         if isinstance(value, int):
-            return True, None
+            return True
 
         if isinstance(value, str):
-            try:
-                int(value)
-                return True, None
-            except ValueError:
-                return False, self.message(field)
+            # Scan the digits instead of paying for a ValueError on junk input
+            value = value.strip()
+            body = value[1:] if value[:1] in ('+', '-') else value
+            return bool(body) and body.isdecimal()
+
+        return False
 
+    async def validate(self, field: str, value: Any, data: dict) -> tuple[bool, Optional[str]]:
+        if self.passes(value):
+            return True, None
         return False, self.message(field)
 
     def message(self, field: str) -> str:
@@ -176,23 +244,30 @@ class Integer(ValidationRule):
 class Numeric(ValidationRule):
     """Field must be numeric (int or float)"""
 
-    async def validate(self, field: str, value: Any, data: dict) -> tuple[bool, Optional[str]]:
-        if value is None or value == '':
-            return True, None
+    __slots__ = ()
+
+    GUARANTEES = frozenset(('numeric',))
+    TYPE_CHECK = 'numeric'
+
+    @staticmethod
+    def passes(value: Any) -> bool:
+        if _empty(value):
+            return True
 
         if isinstance(value, bool):
-            return False, self.message(field)
+            return False
 
         if isinstance(value, (int, float)):
-            return True, None
+            return True
 
         if isinstance(value, str):
-            try:
-                float(value)
-                return True, None
-            except ValueError:
-                return False, self.message(field)
+            return _NUMERIC_RE.fullmatch(value) is not None
+
+        return False
 
+    async def validate(self, field: str, value: Any, data: dict) -> tuple[bool, Optional[str]]:
+        if self.passes(value):
+            return True, None
         return False, self.message(field)
 
     def message(self, field: str) -> str:
@@ -202,21 +277,30 @@ class Numeric(ValidationRule):
 class Boolean(ValidationRule):
     """Field must be boolean (or boolean-like)"""
 
-    async def validate(self, field: str, value: Any, data: dict) -> tuple[bool, Optional[str]]:
-        if value is None or value == '':
-            return True, None
+    __slots__ = ()
 
-        if isinstance(value, bool):
-            return True, None
+    GUARANTEES = frozenset(('boolean',))
+    TYPE_CHECK = 'boolean'
+
+    @staticmethod
+    def passes(value: Any) -> bool:
+        if value is None or (type(value) is str and not value):
+            return True
+
+        if value is True or value is False:
+            return True
 
         if isinstance(value, str):
-            if value.lower() in ('true', 'false', '1', '0', 'yes', 'no'):
-                return True, None
+            return value.lower() in _BOOL_STRS
 
         if isinstance(value, int):
-            if value in (0, 1):
-                return True, None
+            return value == 0 or value == 1
+
+        return False
 
+    async def validate(self, field: str, value: Any, data: dict) -> tuple[bool, Optional[str]]:
+        if self.passes(value):
+            return True, None
         return False, self.message(field)
 
     def message(self, field: str) -> str:
@@ -226,8 +310,12 @@ class Boolean(ValidationRule):
 class Regex(ValidationRule):
     """Field must match regex pattern"""
 
+    __slots__ = ()
+
+    GUARANTEES = frozenset(('str',))
+
     async def validate(self, field: str, value: Any, data: dict) -> tuple[bool, Optional[str]]:
-        if value is None or value == '':
+        if _empty(value):
             return True, None
 
         if not isinstance(value, str):
@@ -243,15 +331,38 @@ class Regex(ValidationRule):
         return f"The {field} format is invalid."
 
 
+def _frozen_parameters(parameters: tuple) -> Optional[frozenset]:
+    """Build a frozenset for O(1) membership, or None if a parameter is unhashable"""
+    try:
+        return frozenset(parameters)
+    except TypeError:
+        return None
+
+
+def _contains(values: Optional[frozenset], parameters: tuple, value: Any) -> bool:
+    """Membership test using the frozenset when possible, falling back to the tuple"""
+    if values is not None:
+        try:
+            return value in values
+        except TypeError:
+            pass
+    return value in parameters
+
+
 class In(ValidationRule):
     """Field must be in list of allowed values"""
 
+    __slots__ = ('_values',)
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self._values = _frozen_parameters(args)
+
     async def validate(self, field: str, value: Any, data: dict) -> tuple[bool, Optional[str]]:
-        if value is None or value == '':
+        if _empty(value):
             return True, None
 
-        allowed = self.parameters
-        if value not in allowed:
+        if not _contains(self._values, self.parameters, value):
             return False, self.message(field)
 
         return True, None
@@ -264,12 +375,17 @@ class In(ValidationRule):
 class NotIn(ValidationRule):
     """Field must not be in list of disallowed values"""
 
+    __slots__ = ('_values',)
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self._values = _frozen_parameters(args)
+
     async def validate(self, field: str, value: Any, data: dict) -> tuple[bool, Optional[str]]:
-        if value is None or value == '':
+        if _empty(value):
             return True, None
 
-        disallowed = self.parameters
-        if value in disallowed:
+        if _contains(self._values, self.parameters, value):
             return False, self.message(field)
 
         return True, None
@@ -282,8 +398,10 @@ class NotIn(ValidationRule):
 class Confirmed(ValidationRule):
     """Field must have matching confirmation field (e.g., password_confirmation)"""
 
+    __slots__ = ()
+
     async def validate(self, field: str, value: Any, data: dict) -> tuple[bool, Optional[str]]:
-        if value is None or value == '':
+        if _empty(value):
             return True, None
 
         confirmation_field = f"{field}_confirmation"
@@ -301,8 +419,10 @@ class Confirmed(ValidationRule):
 class Same(ValidationRule):
     """Field must match another field"""
 
+    __slots__ = ()
+
     async def validate(self, field: str, value: Any, data: dict) -> tuple[bool, Optional[str]]:
-        if value is None or value == '':
+        if _empty(value):
             return True, None
 
         other_field = self.parameters[0]
@@ -320,8 +440,10 @@ class Same(ValidationRule):
 class Different(ValidationRule):
     """Field must be different from another field"""
 
+    __slots__ = ()
+
     async def validate(self, field: str, value: Any, data: dict) -> tuple[bool, Optional[str]]:
-        if value is None or value == '':
+        if _empty(value):
             return True, None
 
         other_field = self.parameters[0]
@@ -339,27 +461,55 @@ class Different(ValidationRule):
 class Url(ValidationRule):
     """Field must be a valid URL"""
 
-    URL_REGEX = re.compile(
-        r'^https?://'  # http:// or https://
-        r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
-        r'localhost|'  # localhost...
-        r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
-        r'(?::\d+)?'  # optional port
-        r'(?:/?|[/?]\S+)$', re.IGNORECASE
-    )
+    __slots__ = ()
+
+    GUARANTEES = frozenset(('str',))
 
     async def validate(self, field: str, value: Any, data: dict) -> tuple[bool, Optional[str]]:
-        if value is None or value == '':
+        if _empty(value):
             return True, None
 
-        if not isinstance(value, str):
+        if not isinstance(value, str) or _WHITESPACE_RE.search(value):
             return False, self.message(field)
 
-        if not self.URL_REGEX.match(value):
+        # urlsplit is a linear scan, no regex backtracking on hostile input
+        try:
+            parts = urlsplit(value)
+            parts.port  # Raises ValueError on an invalid or out of range port
+        except ValueError:
+            return False, self.message(field)
+
+        if parts.scheme not in _URL_SCHEMES or not parts.netloc:
+            return False, self.message(field)
+
+        # Credentials in the URL (http://user:pw@host) are not accepted
+        if parts.username is not None or parts.password is not None:
+            return False, self.message(field)
+
+        if not self._valid_host(parts.hostname):
             return False, self.message(field)
 
         return True, None
 
+    @staticmethod
+    def _valid_host(host: Optional[str]) -> bool:
+        """Host must be localhost, an IP literal or a domain name with a TLD"""
+        if not host:
+            return False
+        if host == 'localhost':
+            return True
+        try:
+            ip_address(host)
+            return True
+        except ValueError:
+            pass
+
+        # Domain: one trailing dot (fully qualified name) is allowed
+        labels = (host[:-1] if host.endswith('.') else host).split('.')
+        if len(labels) < 2 or not _URL_TLD_RE.fullmatch(labels[-1]):
+            return False
+        return all(_URL_LABEL_RE.fullmatch(label) for label in labels[:-1])
+
     def message(self, field: str) -> str:
         return f"The {field} must be a valid URL."
 
@@ -367,26 +517,36 @@ class Url(ValidationRule):
 class Date(ValidationRule):
     """Field must be a valid date"""
 
+    __slots__ = ()
+
     async def validate(self, field: str, value: Any, data: dict) -> tuple[bool, Optional[str]]:
-        if value is None or value == '':
+        if _empty(value):
             return True, None
 
         if isinstance(value, datetime):
             return True, None
 
         if isinstance(value, str):
-            try:
-                # Try ISO format first
-                datetime.fromisoformat(value.replace('Z', '+00:00'))
-                return True, None
-            except ValueError:
-                # Try common formats
-                for fmt in ['%Y-%m-%d', '%Y/%m/%d', '%d-%m-%Y', '%d/%m/%Y']:
-                    try:
-                        datetime.strptime(value, fmt)
-                        return True, None
-                    except ValueError:
-                        continue
+            # Common layouts first: one regex scan, no strptime format parsing
+            match = _DATE_RE.fullmatch(value)
+            if match:
+                if match.group('y1'):
+                    year, month, day = match.group('y1', 'm1', 'd1')
+                else:
+                    year, month, day = match.group('y2', 'm2', 'd2')
+                try:
+                    datetime(int(year), int(month), int(day))
+                    return True, None
+                except ValueError:
+                    return False, self.message(field)
+
+            # ISO 8601 always starts with a four digit year
+            if value[:4].isdigit():
+                try:
+                    datetime.fromisoformat(value.replace('Z', '+00:00') if 'Z' in value else value)
+                    return True, None
+                except ValueError:
+                    pass
 
         return False, self.message(field)
 
@@ -397,8 +557,12 @@ class Date(ValidationRule):
 class Alpha(ValidationRule):
     """Field must contain only alphabetic characters"""
 
+    __slots__ = ()
+
+    GUARANTEES = frozenset(('str',))
+
     async def validate(self, field: str, value: Any, data: dict) -> tuple[bool, Optional[str]]:
-        if value is None or value == '':
+        if _empty(value):
             return True, None
 
         if not isinstance(value, str):
@@ -416,8 +580,12 @@ class Alpha(ValidationRule):
 class AlphaNum(ValidationRule):
     """Field must contain only alphanumeric characters"""
 
+    __slots__ = ()
+
+    GUARANTEES = frozenset(('str',))
+
     async def validate(self, field: str, value: Any, data: dict) -> tuple[bool, Optional[str]]:
-        if value is None or value == '':
+        if _empty(value):
             return True, None
 
         if not isinstance(value, str):
@@ -435,16 +603,21 @@ class AlphaNum(ValidationRule):
 class AlphaDash(ValidationRule):
     """Field must contain only alpha-numeric characters, dashes, and underscores"""
 
-    PATTERN = re.compile(r'^[a-zA-Z0-9_-]+$')
+    __slots__ = ()
+
+    GUARANTEES = frozenset(('str',))
+
+    CHARS = _ALPHA_DASH_CHARS
 
     async def validate(self, field: str, value: Any, data: dict) -> tuple[bool, Optional[str]]:
-        if value is None or value == '':
+        if _empty(value):
             return True, None
 
         if not isinstance(value, str):
             return False, self.message(field)
 
-        if not self.PATTERN.match(value):
+        # Table lookup over the characters (runs in C, no regex engine)
+        if not self.CHARS.issuperset(value):
             return False, self.message(field)
 
         return True, None
@@ -456,14 +629,19 @@ class AlphaDash(ValidationRule):
 class Array(ValidationRule):
     """Field must be an array/list"""
 
-    async def validate(self, field: str, value: Any, data: dict) -> tuple[bool, Optional[str]]:
-        if value is None or value == '':
-            return True, None
+    __slots__ = ()
 
-        if not isinstance(value, (list, tuple)):
-            return False, self.message(field)
+    GUARANTEES = frozenset(('array',))
+    TYPE_CHECK = 'array'
 
-        return True, None
+    @staticmethod
+    def passes(value: Any) -> bool:
+        return value is None or (type(value) is str and not value) or isinstance(value, (list, tuple))
+
+    async def validate(self, field: str, value: Any, data: dict) -> tuple[bool, Optional[str]]:
+        if self.passes(value):
+            return True, None
+        return False, self.message(field)
 
     def message(self, field: str) -> str:
         return f"The {field} must be an array."
@@ -472,16 +650,20 @@ class Array(ValidationRule):
 class Json(ValidationRule):
     """Field must be valid JSON"""
 
+    __slots__ = ()
+
+    GUARANTEES = frozenset(('str', 'json'))
+    TYPE_CHECK = 'json'
+
     async def validate(self, field: str, value: Any, data: dict) -> tuple[bool, Optional[str]]:
-        if value is None or value == '':
+        if value is None or (type(value) is str and not value):
             return True, None
 
         if isinstance(value, str):
             try:
-                import json
-                json.loads(value)
+                _json_loads(value)
                 return True, None
-            except json.JSONDecodeError:
+            except _JSONDecodeError:
                 return False, self.message(field)
 
         return False, self.message(field)
@@ -490,15 +672,43 @@ class Json(ValidationRule):
         return f"The {field} must be valid JSON."
 
 
-# Import database and file rules
-from larasanic.validation.database_rules import Unique, Exists
-from larasanic.validation.file_rules import (
-    File, Image, Mimes, MimeTypes,
-    MaxFileSize, MinFileSize, Dimensions
-)
+class _LazyRuleMap(dict):
+    """Rule map that imports database and file rules on first use"""
+
+    _LAZY = {
+        # Database rules
+        'unique': ('larasanic.validation.database_rules', 'Unique'),
+        'exists': ('larasanic.validation.database_rules', 'Exists'),
+        # File rules
+        'file': ('larasanic.validation.file_rules', 'File'),
+        'image': ('larasanic.validation.file_rules', 'Image'),
+        'mimes': ('larasanic.validation.file_rules', 'Mimes'),
+        'mimetypes': ('larasanic.validation.file_rules', 'MimeTypes'),
+        'max_file_size': ('larasanic.validation.file_rules', 'MaxFileSize'),
+        'min_file_size': ('larasanic.validation.file_rules', 'MinFileSize'),
+        'dimensions': ('larasanic.validation.file_rules', 'Dimensions'),
+    }
+
+    def __missing__(self, key):
+        if key not in self._LAZY:
+            raise KeyError(key)
+        module_name, class_name = self._LAZY[key]
+        rule_class = getattr(importlib.import_module(module_name), class_name)
+        self[key] = rule_class
+        return rule_class
+
+    def __contains__(self, key) -> bool:
+        return dict.__contains__(self, key) or key in self._LAZY
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
 
 # Map of rule names to rule classes
-RULE_MAP = {
+RULE_MAP = _LazyRuleMap({
     # Basic rules
     'required': Required,
     'email': Email,
@@ -521,15 +731,14 @@ RULE_MAP = {
     'alpha_dash': AlphaDash,
     'array': Array,
     'json': Json,
-    # Database rules
-    'unique': Unique,
-    'exists': Exists,
-    # File rules
-    'file': File,
-    'image': Image,
-    'mimes': Mimes,
-    'mimetypes': MimeTypes,
-    'max_file_size': MaxFileSize,
-    'min_file_size': MinFileSize,
-    'dimensions': Dimensions,
+})
+
+# Shared instances of parameterless rules (rules are stateless, so one instance serves every field)
+RULE_SINGLETONS = {
+    name: rule_class()
+    for name, rule_class in RULE_MAP.items()
+    if rule_class in (
+        Required, Email, String, Integer, Numeric, Boolean, Url, Date,
+        Alpha, AlphaNum, AlphaDash, Array, Json
+    )
 }
@@ -0,0 +1,78 @@
+"""
+Batch Validation Rules
+Column-wise validation with the simple type rules
+"""
+from typing import Any, Dict, List, Optional, Union
+from larasanic.validation.rules import RULE_SINGLETONS, Required, String, Integer, Numeric, Boolean, Array
+from larasanic.validation.fields import custom_message, display_name, index_messages, resolve_field_values
+
+# Rules with a synchronous, value-only check (rule name => rule class)
+BATCH_RULES = {
+    'required': Required,
+    'string': String,
+    'integer': Integer,
+    'numeric': Numeric,
+    'boolean': Boolean,
+    'array': Array,
+}
+
+
+def validate_batch(
+    data: Dict[str, Any],
+    rules: Dict[str, Union[str, List[str]]],
+    messages: Optional[Dict[str, str]] = None,
+    custom_attributes: Optional[Dict[str, str]] = None
+) -> Dict[str, List[str]]:
+    """
+    Validate many fields against the simple type rules in one pass per rule
+
+    Each rule runs once over the column of all fields that use it, then the first
+    failing rule of every field is reported (same order semantics as Validator).
+    Only the rules in BATCH_RULES are supported; use Validator for anything else.
+
+    Args:
+        data: Data to validate
+        rules: Validation rules (field => 'rule1|rule2' or ['rule1', 'rule2'])
+        messages: Custom error messages (field.rule or rule => message)
+        custom_attributes: Custom field names for error messages
+
+    Returns:
+        Dictionary of field errors (empty if everything passed)
+
+    Raises:
+        ValueError: If a rule is not supported in batch mode
+
+    Example:
+        errors = validate_batch(request.args, {'page': 'integer', 'q': 'required|string'})
+    """
+    # Group fields by rule name
+    field_rules: Dict[str, List[str]] = {}
+    columns: Dict[str, List[str]] = {}
+    for field, rule_def in rules.items():
+        names = rule_def.split('|') if isinstance(rule_def, str) else list(rule_def)
+        names = [name.strip() for name in names if name.strip()]
+        for name in names:
+            if name not in BATCH_RULES:
+                raise ValueError(f"Rule '{name}' is not supported in batch validation")
+            columns.setdefault(name, []).append(field)
+        field_rules[field] = names
+
+    # Run each rule once over its column
+    values = resolve_field_values(data, tuple(field_rules))
+    results: Dict[tuple, bool] = {}
+    for name, fields in columns.items():
+        for field, passed in zip(fields, map(BATCH_RULES[name].passes, [values[f] for f in fields])):
+            results[(field, name)] = passed
+
+    # Report the first failing rule per field
+    message_index = index_messages(messages or {})
+    custom_attributes = custom_attributes or {}
+    errors: Dict[str, List[str]] = {}
+    for field, names in field_rules.items():
+        for name in names:
+            if not results[(field, name)]:
+                message = custom_message(message_index, field, name)
+                errors[field] = [message or RULE_SINGLETONS[name].message(display_name(field, custom_attributes))]
+                break
+
+    return errors
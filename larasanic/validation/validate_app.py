@@ -1,12 +1,16 @@
+import os
 import sys
 from larasanic.support.config_validator import validate_all_configs, ConfigValidationError
 
+# Set once the configuration passed; inherited by Sanic workers and reloader processes
+VALIDATED_ENV_KEY = 'LARASANIC_CONFIG_VALIDATED'
+
+
 class ValidateApp:
-    _validated: bool = False
 
     @classmethod
     def validate_startup_app(cls):
-        if not cls._validated:
+        if os.environ.get(VALIDATED_ENV_KEY) != '1':
             # Validate configuration before starting (fail fast on config errors)
             try:
                 validators = validate_all_configs()
@@ -24,6 +28,8 @@ class ValidateApp:
                 if has_warnings:
                     print()  # Add blank line after warnings
 
+                os.environ[VALIDATED_ENV_KEY] = '1'
+
             except ConfigValidationError as e:
                 print("\n" + "=" * 70)
                 print("✗ CONFIGURATION VALIDATION FAILED")
@@ -32,5 +38,3 @@ class ValidateApp:
                 print("\nPlease fix the configuration errors before starting the application.")
                 print("=" * 70)
                 sys.exit(1)
-
-ValidateApp.validate_startup_app()
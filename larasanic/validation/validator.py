@@ -2,11 +2,20 @@
 Validator
 Laravel-style validation engine
 """
+import asyncio
+from functools import lru_cache
 from typing import Dict, List, Any, Optional, Union, Callable
 from larasanic.validation.exceptions import ValidationException
-from larasanic.validation.rules import RULE_MAP, ValidationRule
+from larasanic.validation.rules import RULE_MAP, RULE_SINGLETONS, ValidationRule
+from larasanic.validation.fields import custom_message, display_name, index_messages, resolve_field_values
 import re
 
+# Markers that only affect how missing values are handled
+_MARKER_RULES = frozenset(('nullable', 'sometimes'))
+
+# Rule parameter: "double quoted", 'single quoted' or a plain comma-separated value
+_PARAM_RE = re.compile(r'\s*(?:"([^"]*)"|\'([^\']*)\'|([^,]+))')
+
 
 class Validator:
     """
@@ -32,12 +41,19 @@ class Validator:
         validated = await validator.validate()  # Raises ValidationException if fails
     """
 
+    __slots__ = (
+        'data', 'rules', 'messages', 'custom_attributes', '_errors', '_validated_data',
+        '_custom_rules', '_max_concurrency', '_value_cache', '_display_names',
+        '_message_index', '_field_paths', '_plan',
+    )
+
     def __init__(
         self,
         data: Dict[str, Any],
         rules: Dict[str, Union[str, List]],
         messages: Optional[Dict[str, str]] = None,
-        custom_attributes: Optional[Dict[str, str]] = None
+        custom_attributes: Optional[Dict[str, str]] = None,
+        max_concurrency: Optional[int] = None
     ):
         """
         Initialize validator
@@ -47,14 +63,39 @@ class Validator:
             rules: Validation rules (field => rule string or list)
             messages: Custom error messages (rule.field => message)
             custom_attributes: Custom field names for error messages
+            max_concurrency: Max fields validated at once (None = unbounded)
         """
         self.data = data
+        self._field_paths: Dict[str, tuple] = {}
         self.rules = self._normalize_rules(rules)
         self.messages = messages or {}
         self.custom_attributes = custom_attributes or {}
         self._errors: Dict[str, List[str]] = {}
         self._validated_data: Dict[str, Any] = {}
         self._custom_rules: Dict[str, Callable] = {}
+        self._max_concurrency = max_concurrency
+        self._value_cache: Dict[str, Any] = {}
+        self._display_names = {field: display_name(field, self.custom_attributes) for field in self.rules}
+        self._message_index = index_messages(self.messages)
+        self._plan = self._build_plan()
+
+    def _build_plan(self) -> tuple:
+        """
+        Get the compiled validation plan for the current rules
+
+        Plans are cached per distinct rule set, so validators built from the same
+        static rules dict (the usual per-request case) skip parsing entirely.
+
+        Returns:
+            Tuple of (field, ((rule_name, params, rule), ...), required)
+        """
+        rules_key = tuple((field, tuple(rules_list)) for field, rules_list in self.rules.items())
+        custom_rules = frozenset(self._custom_rules)
+        try:
+            return _compile_plan(rules_key, custom_rules)
+        except TypeError:
+            # Unhashable rule definitions can't be cached
+            return _compile_plan.__wrapped__(rules_key, custom_rules)
 
     def _normalize_rules(self, rules: Dict[str, Union[str, List]]) -> Dict[str, List[str]]:
         """
@@ -76,9 +117,12 @@ class Validator:
                     normalized[field] = rule_def
                 case _:
                     normalized[field] = [str(rule_def)]
+            # Dot-notation paths are split once, not on every lookup
+            self._field_paths[field] = tuple(field.split('.'))
         return normalized
 
-    def _parse_rule(self, rule_string: str) -> tuple[str, List[Any]]:
+    @staticmethod
+    def _parse_rule(rule_string: str) -> tuple[str, List[Any]]:
         """
         Parse rule string into name and parameters
 
@@ -93,28 +137,24 @@ class Validator:
 
         rule_name, params_string = rule_string.split(':', 1)
 
-        # Parse parameters
-        # Handle comma-separated values, but respect quoted strings
-        params = []
-        current_param = ''
-        in_quotes = False
-
-        for char in params_string:
-            if char == '"' or char == "'":
-                in_quotes = not in_quotes
-            elif char == ',' and not in_quotes:
-                if current_param:
-                    params.append(self._cast_parameter(current_param.strip()))
-                current_param = ''
-                continue
-            current_param += char
+        # Fast path: plain comma-separated values
+        if '"' not in params_string and "'" not in params_string:
+            return rule_name, [
+                Validator._cast_parameter(param.strip()) for param in params_string.split(',') if param
+            ]
 
-        if current_param:
-            params.append(self._cast_parameter(current_param.strip()))
+        # Quoted values may contain commas and are kept as strings
+        params = []
+        for quoted_double, quoted_single, plain in _PARAM_RE.findall(params_string):
+            if plain:
+                params.append(Validator._cast_parameter(plain.strip()))
+            else:
+                params.append(quoted_double or quoted_single)
 
         return rule_name, params
 
-    def _cast_parameter(self, param: str) -> Any:
+    @staticmethod
+    def _cast_parameter(param: str) -> Any:
         """
         Cast parameter to appropriate type
 
@@ -129,20 +169,19 @@ class Validator:
            (param.startswith("'") and param.endswith("'")):
             return param[1:-1]
 
-        # Try to cast to int
-        try:
+        # Only numeric-looking values go through int()/float()
+        first = param[:1]
+        if not (first.isdecimal() or first in ('-', '+', '.')):
+            return param
+
+        digits = param[1:] if first in ('-', '+') else param
+        if digits.isdecimal():
             return int(param)
-        except ValueError:
-            pass
 
-        # Try to cast to float
         try:
             return float(param)
         except ValueError:
-            pass
-
-        # Return as string
-        return param
+            return param
 
     def _get_field_value(self, field: str) -> Any:
         """
@@ -154,95 +193,77 @@ class Validator:
         Returns:
             Field value or None
         """
-        if '.' not in field:
-            return self.data.get(field)
+        # Resolved once per run by _resolve_values()
+        if field in self._value_cache:
+            return self._value_cache[field]
 
-        # Handle nested fields
-        keys = field.split('.')
-        value = self.data
+        path = self._field_paths.get(field)
+        if path is None:
+            path = tuple(field.split('.'))
 
-        for key in keys:
-            if isinstance(value, dict):
-                value = value.get(key)
-            else:
+        value = self.data
+        for key in path:
+            if not isinstance(value, dict):
                 return None
+            value = value.get(key)
 
         return value
 
-    def _get_field_display_name(self, field: str) -> str:
+    def _resolve_values(self) -> Dict[str, Any]:
         """
-        Get display name for field (uses custom attributes or field name)
+        Resolve every field's value in one walk of the data
 
-        Args:
-            field: Field name
+        Fields sharing a dot-notation prefix (user.profile.email, user.profile.name)
+        share the lookups for that prefix.
 
         Returns:
-            Display name
-        """
-        return self.custom_attributes.get(field, field.replace('_', ' '))
-
-    def _get_custom_message(self, field: str, rule_name: str) -> Optional[str]:
+            Dictionary of field => value
         """
-        Get custom error message
+        return resolve_field_values(self.data, tuple(field for field, _, _ in self._plan))
 
-        Args:
-            field: Field name
-            rule_name: Rule name
-
-        Returns:
-            Custom message or None
-        """
-        # Check for field.rule format
-        key = f"{field}.{rule_name}"
-        if key in self.messages:
-            return self.messages[key]
-
-        # Check for just rule name
-        if rule_name in self.messages:
-            return self.messages[rule_name]
-
-        return None
-
-    async def _validate_field(self, field: str, rule_string: str) -> Optional[str]:
+    async def _validate_field(
+        self,
+        field: str,
+        value: Any,
+        rule_name: str,
+        params: tuple,
+        rule: Optional[ValidationRule]
+    ) -> Optional[str]:
         """
-        Validate field against single rule
+        Validate field against single compiled rule
 
         Args:
             field: Field name
-            rule_string: Rule string (e.g., 'min:5')
+            value: Field value
+            rule_name: Rule name (e.g., 'min')
+            params: Rule parameters (e.g., (5,))
+            rule: Built-in rule instance (None for custom or unknown rules)
 
         Returns:
             Error message or None if valid
         """
-        rule_name, params = self._parse_rule(rule_string)
-        value = self._get_field_value(field)
-
         # Check for custom rule
         if rule_name in self._custom_rules:
             is_valid = await self._custom_rules[rule_name](field, value, self.data, *params)
             if not is_valid:
-                custom_msg = self._get_custom_message(field, rule_name)
-                return custom_msg or f"The {self._get_field_display_name(field)} field failed {rule_name} validation."
+                custom_msg = custom_message(self._message_index, field, rule_name)
+                return custom_msg or f"The {self._display_names[field]} field failed {rule_name} validation."
             return None
 
         # Check for built-in rule
-        if rule_name not in RULE_MAP:
+        if rule is None:
             raise ValueError(f"Unknown validation rule: {rule_name}")
 
-        # Instantiate rule class
-        rule_class = RULE_MAP[rule_name]
-        rule_instance = rule_class(*params)
-
         # Run validation
-        is_valid, error_message = await rule_instance.validate(
-            self._get_field_display_name(field),
+        is_valid, error_message = await rule.validate(
+            self._display_names[field],
             value,
             self.data
         )
 
         if not is_valid:
             # Check for custom message
-            custom_msg = self._get_custom_message(field, rule_name)
+            custom_msg = custom_message(self._message_index, field, rule_name)
             return custom_msg or error_message
 
         return None
@@ -271,28 +292,69 @@ class Validator:
 
         return self._validated_data
 
+    async def _run_field(
+        self,
+        field: str,
+        steps: tuple,
+        required: bool,
+        semaphore: Optional[asyncio.Semaphore] = None
+    ) -> tuple[str, List[str], Any]:
+        """
+        Run a field's compiled rules, stopping on the first error
+
+        Args:
+            field: Field name
+            steps: Compiled rules for the field
+            required: Whether the field has a required rule
+            semaphore: Optional semaphore bounding concurrent fields
+
+        Returns:
+            Tuple of (field, errors, value)
+        """
+        value = self._get_field_value(field)
+
+        # Missing optional field: nothing to validate (Laravel behavior), but a
+        # misspelled rule name must still fail as it does when a value is present
+        if value is None and not required:
+            for rule_name, _, rule in steps:
+                if rule is None and rule_name not in self._custom_rules:
+                    raise ValueError(f"Unknown validation rule: {rule_name}")
+            return field, [], value
+
+        if semaphore is not None:
+            async with semaphore:
+                return await self._run_field(field, steps, required)
+
+        for rule_name, params, rule in steps:
+            error = await self._validate_field(field, value, rule_name, params, rule)
+            if error:
+                # Stop on first error for this field (Laravel behavior)
+                return field, [error], value
+
+        return field, [], value
+
     async def run(self):
-        """Run all validations"""
+        """Run all validations (fields are independent and validated concurrently)"""
         self._errors = {}
         self._validated_data = {}
-        
-        for field, rules_list in self.rules.items():
-            field_errors = []
+        self._value_cache = self._resolve_values()
+
+        semaphore = asyncio.Semaphore(self._max_concurrency) if self._max_concurrency else None
+        results = await asyncio.gather(
+            *(self._run_field(field, steps, required, semaphore) for field, steps, required in self._plan),
+            return_exceptions=True
+        )
 
-            for rule_string in rules_list:
-                error = await self._validate_field(field, rule_string)
-                if error:
-                    field_errors.append(error)
-                    # Stop on first error for this field (Laravel behavior)
-                    break
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
 
+            field, field_errors, value = result
             if field_errors:
                 self._errors[field] = field_errors
-            else:
+            elif value is not None:
                 # Add to validated data if no errors
-                value = self._get_field_value(field)
-                if value is not None:
-                    self._validated_data[field] = value
+                self._validated_data[field] = value
 
     async def passes(self) -> bool:
         """
@@ -375,6 +437,7 @@ class Validator:
             validator.add_rule('not_reserved', validate_username)
         """
         self._custom_rules[name] = callback
+        self._plan = self._build_plan()
         return self
 
     def sometimes(self, field: str, rules: Union[str, List[str]], condition: Callable) -> 'Validator':
@@ -395,12 +458,16 @@ class Validator:
         if condition(self.data):
             if field not in self.rules:
                 self.rules[field] = []
+                self._field_paths[field] = tuple(field.split('.'))
+                self._display_names[field] = display_name(field, self.custom_attributes)
 
             if isinstance(rules, str):
                 self.rules[field].extend([r.strip() for r in rules.split('|')])
             else:
                 self.rules[field].extend(rules)
 
+            self._plan = self._build_plan()
+
         return self
 
     def get_first_error(self, field: str = None) -> str:
@@ -437,6 +504,71 @@ class Validator:
         return field in self._errors and len(self._errors[field]) > 0
 
 
+@lru_cache(maxsize=2048)
+def _get_rule_instance(rule_name: str, params: tuple, param_types: tuple) -> ValidationRule:
+    """
+    Get a shared rule instance (rules are stateless, so equal rules share one object)
+
+    Args:
+        rule_name: Built-in rule name
+        params: Rule parameters
+        param_types: Types of the parameters, part of the cache key since equal
+            values of different types (1 and 1.0) hash alike
+
+    Returns:
+        Rule instance
+    """
+    if not params and rule_name in RULE_SINGLETONS:
+        return RULE_SINGLETONS[rule_name]
+    return RULE_MAP[rule_name](*params)
+
+
+@lru_cache(maxsize=1024)
+def _compile_plan(rules_key: tuple, custom_rules: frozenset) -> tuple:
+    """
+    Parse normalized rules into a validation plan
+
+    Type-check rules already guaranteed by an earlier rule in the same chain are
+    dropped, e.g. 'email|string' only runs 'email' since a passing email is a string.
+    'nullable' and 'sometimes' are markers rather than rules: they are dropped too.
+
+    Args:
+        rules_key: Tuple of (field, (rule_string, ...))
+        custom_rules: Names of custom rules registered on the validator
+
+    Returns:
+        Tuple of (field, ((rule_name, params, rule), ...), required)
+    """
+    plan = []
+    for field, rules_list in rules_key:
+        steps = []
+        guarantees = set()
+        required = False
+
+        for rule_string in rules_list:
+            rule_name, params = Validator._parse_rule(rule_string)
+            if rule_name in _MARKER_RULES and rule_name not in custom_rules:
+                continue
+            if rule_name == 'required' or rule_name.startswith('required_'):
+                required = True
+
+            rule_class = None if rule_name in custom_rules else RULE_MAP.get(rule_name)
+
+            if rule_class is not None:
+                if rule_class.TYPE_CHECK is not None and rule_class.TYPE_CHECK in guarantees:
+                    continue
+                guarantees.update(rule_class.GUARANTEES)
+
+            params = tuple(params)
+            rule = None
+            if rule_class is not None:
+                rule = _get_rule_instance(rule_name, params, tuple(type(param) for param in params))
+            steps.append((rule_name, params, rule))
+
+        plan.append((field, tuple(steps), required))
+    return tuple(plan)
+
+
 # Global helper function
 async def validate(
     data: Dict[str, Any],
@@ -2,19 +2,147 @@
 View Engine
 Smart, unified rendering engine with automatic detection
 """
+import asyncio
+import contextvars
+import functools
+import hashlib
 import json
-from typing import Optional, Dict, Any, TYPE_CHECKING
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, Union, TYPE_CHECKING
 from swiftblade.exceptions import TemplateNotFoundException
 from larasanic.support import Config
+from larasanic.defaults import (
+    DEFAULT_BLADE_RENDER_WORKERS,
+    DEFAULT_BLADE_RENDER_CACHE_TTL,
+    DEFAULT_BLADE_RENDER_CACHE_SIZE,
+    DEFAULT_BLADE_RENDER_CACHE_SKIP_KEYS,
+)
 from larasanic.view.context import build_context
 from larasanic.support.facades import TemplateBlade, App
 from larasanic.support.facades import HttpRequest
 
+# orjson for the SPA JSON payloads, stdlib json as fallback
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+# Dedicated pool for Blade rendering (created on first render, sized by template.RENDER_WORKERS)
+_render_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_render_executor() -> ThreadPoolExecutor:
+    """Get the Blade render thread pool, kept apart from the default to_thread executor"""
+    global _render_executor
+    if _render_executor is None:
+        _render_executor = ThreadPoolExecutor(
+            max_workers=Config.get('template.RENDER_WORKERS', DEFAULT_BLADE_RENDER_WORKERS),
+            thread_name_prefix='blade-render'
+        )
+    return _render_executor
+
+
+async def _run_render(func, *args):
+    """Run a blocking render in the Blade pool, keeping the request context (like to_thread)"""
+    ctx = contextvars.copy_context()
+    return await asyncio.get_running_loop().run_in_executor(
+        _get_render_executor(),
+        functools.partial(ctx.run, func, *args)
+    )
+
+
+class _RenderCache:
+    """
+    Small in-process LRU + TTL cache of rendered HTML
+
+    Entries are shared by every visitor, so templates rendered with the cache on
+    must not read request state through globals or directives (csrf, session,
+    request()): only the context is part of the key. Requests with an authenticated
+    user always bypass the cache, since auth() reads the user from the request.
+    """
+
+    def __init__(self):
+        self._entries: OrderedDict = OrderedDict()
+
+    @staticmethod
+    def make_key(template: str, context: Dict[str, Any]) -> Optional[tuple]:
+        """
+        Build a cache key from the template name and a stable hash of the context
+
+        Returns None when the request has an authenticated user, when the context
+        must not be cached (per-user data such as CSRF tokens or flash messages) or
+        when it is not plain JSON: objects would be keyed by their str(), and two
+        users rendering "<User>" would share one entry.
+        """
+        skip_keys = Config.get('template.RENDER_CACHE_SKIP_KEYS', DEFAULT_BLADE_RENDER_CACHE_SKIP_KEYS)
+        if any(key in context for key in skip_keys):
+            return None
+        # The auth() template global exposes the logged-in user outside the context
+        try:
+            if HttpRequest.get_user() is not None:
+                return None
+        except Exception:
+            # No request context (e.g. rendering from a command): nobody is logged in
+            pass
+        try:
+            serialized = json.dumps(context, sort_keys=True)
+        except (TypeError, ValueError):
+            return None
+        return template, hashlib.blake2b(serialized.encode(), digest_size=16).digest()
+
+    def get(self, key: tuple) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, content = entry
+        if expires_at < time.monotonic():
+            self._entries.pop(key, None)
+            return None
+        self._entries.move_to_end(key)
+        return content
+
+    def put(self, key: tuple, content: str):
+        ttl = Config.get('template.RENDER_CACHE_TTL', DEFAULT_BLADE_RENDER_CACHE_TTL)
+        self._entries[key] = (time.monotonic() + ttl, content)
+        self._entries.move_to_end(key)
+        max_size = Config.get('template.RENDER_CACHE_SIZE', DEFAULT_BLADE_RENDER_CACHE_SIZE)
+        while len(self._entries) > max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+
+
+_render_cache = _RenderCache()
+
+
+async def _render_cached(render, template: str, context: Dict[str, Any]) -> str:
+    """Render through the cache when template.RENDER_CACHE_ENABLED is on"""
+    if not Config.get('template.RENDER_CACHE_ENABLED', False):
+        return await _run_render(render, template, context)
+
+    key = _render_cache.make_key(template, context)
+    if key is None:
+        return await _run_render(render, template, context)
+
+    content = _render_cache.get(key)
+    if content is None:
+        content = await _run_render(render, template, context)
+        _render_cache.put(key, content)
+    return content
+
 
 class ViewEngine:
     """
     Unified view rendering engine
     """
+
+    __slots__ = ('template', 'context', 'config')
+
     def __init__(
         self,
         template: str = None,
@@ -28,9 +156,12 @@ class ViewEngine:
         self.context = context or {}
         self.config = Config.as_object('template.BLADE_VIEW_CONFIG')
 
-    async def render(self) -> str:
+    async def render(self) -> Union[str, bytes, dict]:
         """
         Render the view template to HTML string
+
+        SPA requests without a template get the context as JSON bytes, and SPA
+        requests for a template get {'html': content}.
         """
         if not App.has('template_blade'):
             raise RuntimeError(
@@ -41,8 +172,10 @@ class ViewEngine:
         spa_mode = HttpRequest.has_spa_header()
 
         if self.template is None and spa_mode:
-            # Return JSON immediately without template rendering
-            return json.dumps(self.context or {})
+            # Return JSON bytes immediately without template rendering
+            if ORJSON_AVAILABLE:
+                return orjson.dumps(self.context or {}, option=orjson.OPT_NON_STR_KEYS)
+            return json.dumps(self.context or {}).encode('utf-8')
 
         # Build context (only when needed for template rendering)
         template_context = await build_context(context=self.context)
@@ -51,12 +184,10 @@ class ViewEngine:
             # Add to layout context
             layout_context = template_context.copy()
 
-            # Run Blade rendering in thread pool to avoid blocking event loop
-            import asyncio
-
+            # Run Blade rendering in its own thread pool to avoid blocking event loop
             if self.template is None and not spa_mode:
                 # Render SPA base layout
-                content = await asyncio.to_thread(
+                content = await _render_cached(
                     blade_template_engine.render,
                     self.config.spa_layout,
                     layout_context
@@ -64,7 +195,7 @@ class ViewEngine:
                 return content
             else:  # 'direct'
                 # Render template directly (no layout)
-                content = await asyncio.to_thread(
+                content = await _render_cached(
                     blade_template_engine.render,
                     self.template,
                     template_context
@@ -11,22 +11,23 @@ class WebSocketGuard:
     """WebSocket authentication guard"""
 
     def __init__(self):
-        pass
+        # Close code is static, read it once instead of on every handshake
+        self._close_code = Config.get('security.WS_AUTH_CLOSE_CODE')
 
     async def authenticate_websocket(self, request: Request, ws) -> Optional[int]:
         from larasanic.support.facades import HttpRequest
         try:
             user = HttpRequest.get_user()
             if not user:
-                await ws.close(code=Config.get('security.WS_AUTH_CLOSE_CODE'), reason="Authentication failed")
+                await ws.close(code=self._close_code, reason="Authentication failed")
                 return None
 
             if not user.id:
-                await ws.close(code=Config.get('security.WS_AUTH_CLOSE_CODE'), reason="Authentication failed")
+                await ws.close(code=self._close_code, reason="Authentication failed")
                 return None
 
             return user.id
 
         except Exception as e:
-            await ws.close(code=Config.get('security.WS_AUTH_CLOSE_CODE'), reason="Authentication failed")
+            await ws.close(code=self._close_code, reason="Authentication failed")
             return None
@@ -6,8 +6,8 @@ Supports Redis pub/sub for horizontal scaling across multiple processes
 """
 import json
 import asyncio
+import time
 from typing import Dict, Set, Any, Optional
-from datetime import datetime
 from sanic import Request
 
 # Redis for inter-process communication
@@ -18,6 +18,64 @@ except ImportError:
     REDIS_AVAILABLE = False
     aioredis = None
 
+# orjson for fast message (de)serialization, stdlib json as fallback
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+
+# msgpack for the intra-cluster Redis payloads, JSON as fallback
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+    msgpack = None
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize a message to JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data).encode('utf-8')
+
+
+def _loads(message) -> Any:
+    """Parse a JSON message (str or bytes); raises json.JSONDecodeError on invalid input"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(message)
+    return json.loads(message)
+
+
+def _pack_bus(data: Any) -> bytes:
+    """Encode a Redis pub/sub payload (only read by other processes of this app)"""
+    if MSGPACK_AVAILABLE:
+        try:
+            return msgpack.packb(data, use_bin_type=True)
+        except TypeError:
+            # Types msgpack can't encode natively (e.g. datetime) go as JSON
+            pass
+    return _dumps(data)
+
+
+def _unpack_bus(payload: bytes) -> Any:
+    """Decode a Redis pub/sub payload; JSON objects start with '{', msgpack maps never do"""
+    if payload[:1] in (b'{', '{') or not MSGPACK_AVAILABLE:
+        return _loads(payload)
+    # Payloads may carry non-str map keys (e.g. user ids), which msgpack rejects by default
+    return msgpack.unpackb(payload, raw=False, strict_map_key=False)
+
+
+# Max messages sent per Redis pipeline round-trip
+PUBLISH_BATCH_SIZE = 100
+
+# Seconds shutdown waits for queued publishes to reach Redis
+SHUTDOWN_FLUSH_TIMEOUT = 5.0
+
+
 class WebSocketManager:
     """
     Manages WebSocket connections and message broadcasting
@@ -27,6 +85,9 @@ class WebSocketManager:
     - Multi-process: Uses Redis pub/sub to broadcast across processes
     """
 
+    # Redis URL, resolved on first use
+    _redis_url: Optional[str] = None
+
     def __init__(self, ws_guard):
         """
         Initialize WebSocket manager
@@ -35,6 +96,8 @@ class WebSocketManager:
             ws_guard: WebSocketGuard instance for authentication
         """
         self.connections: Dict[int, Set[Any]] = {}
+        # Flat view of every socket, kept in sync with connections (used by broadcasts)
+        self._all_sockets: Set[Any] = set()
         self.guard = ws_guard
 
         # Redis for multi-process support
@@ -42,20 +105,36 @@ class WebSocketManager:
         self.redis_pubsub: Optional[Any] = None
         self.subscriber_task: Optional[asyncio.Task] = None
 
+        # Outgoing (channel, data, payload) publishes, flushed to Redis in pipelined batches
+        self._publish_queue: Optional[asyncio.Queue] = None
+        self.flusher_task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def _get_redis_url(cls) -> str:
+        """
+        Get the Redis URL (resolved once and shared by all managers)
+
+        Returns:
+            Redis connection URL
+        """
+        if cls._redis_url is None:
+            from larasanic.support import EnvHelper
+            from larasanic.defaults import DEFAULT_REDIS_URL
+            cls._redis_url = EnvHelper.get('REDIS_URL', DEFAULT_REDIS_URL)
+        return cls._redis_url
+
     async def _init_redis(self):
         """Initialize Redis client for pub/sub (lazy initialization)"""
         if not REDIS_AVAILABLE or self.redis_client:
             return
 
         try:
-            from larasanic.support import EnvHelper
-            from larasanic.defaults import DEFAULT_REDIS_URL
-            redis_url = EnvHelper.get('REDIS_URL', DEFAULT_REDIS_URL)
+            redis_url = self._get_redis_url()
 
+            # Raw bytes: pub/sub payloads go straight to the JSON parser
             self.redis_client = aioredis.from_url(
                 redis_url,
-                encoding='utf-8',
-                decode_responses=True
+                decode_responses=False
             )
             self.redis_pubsub = self.redis_client.pubsub()
             print(f"[WebSocket] Redis connected: {redis_url}")
@@ -63,8 +142,12 @@ class WebSocketManager:
             print(f"[WebSocket] Redis connection failed: {e}")
             self.redis_client = None
 
+    async def startup(self):
+        """Start the Redis subscriber (called before the server starts accepting connections)"""
+        await self._start_redis_subscriber()
+
     async def _start_redis_subscriber(self):
-        """Start Redis subscriber task (auto-start on first WebSocket connection)"""
+        """Start Redis subscriber task (for multi-process support)"""
         if self.subscriber_task or not REDIS_AVAILABLE:
             return
 
@@ -81,7 +164,7 @@ class WebSocketManager:
                 async for message in self.redis_pubsub.listen():
                     if message['type'] == 'message':
                         try:
-                            data = json.loads(message['data'])
+                            data = _unpack_bus(message['data'])
                             channel = data.get('channel')
                             payload = data.get('data')
 
@@ -94,6 +177,47 @@ class WebSocketManager:
 
         self.subscriber_task = asyncio.create_task(subscriber())
 
+        # Publishes from this process are batched from now on
+        self._publish_queue = asyncio.Queue()
+        self.flusher_task = asyncio.create_task(self._flush_publishes())
+
+    async def _flush_publishes(self):
+        """Drain the publish queue, sending each burst in one Redis pipeline round-trip"""
+        while True:
+            batch = [await self._publish_queue.get()]
+            while not self._publish_queue.empty() and len(batch) < PUBLISH_BATCH_SIZE:
+                batch.append(self._publish_queue.get_nowait())
+
+            try:
+                async with self.redis_client.pipeline(transaction=False) as pipe:
+                    for _, _, message in batch:
+                        pipe.publish('ws:broadcast', message)
+                    await pipe.execute()
+            except Exception as e:
+                print(f"[WebSocket] Redis publish failed ({len(batch)} messages): {e}")
+                # Already reported as published: at least reach this process's sockets
+                for channel, data, _ in batch:
+                    await self.broadcast_to_all(channel, data)
+            finally:
+                for _ in batch:
+                    self._publish_queue.task_done()
+
+    async def shutdown(self):
+        """Flush queued publishes and stop the Redis tasks (called after the server stops)"""
+        if self.flusher_task and not self.flusher_task.done():
+            try:
+                await asyncio.wait_for(self._publish_queue.join(), SHUTDOWN_FLUSH_TIMEOUT)
+            except asyncio.TimeoutError:
+                print(f"[WebSocket] Dropping {self._publish_queue.qsize()} unsent Redis publishes")
+
+        tasks = [task for task in (self.subscriber_task, self.flusher_task) if task]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self.subscriber_task = None
+        self.flusher_task = None
+        self._publish_queue = None
+
     async def _publish_to_redis(self, channel: str, data: Any) -> bool:
         """
         Publish message to Redis (for multi-process broadcasting)
@@ -103,7 +227,8 @@ class WebSocketManager:
             data: Message data
 
         Returns:
-            True if published successfully
+            True if published or queued for the next pipelined batch (a queued
+            batch that fails to send is broadcast to local connections instead)
         """
         if not REDIS_AVAILABLE:
             return False
@@ -113,7 +238,14 @@ class WebSocketManager:
             return False
 
         try:
-            message = json.dumps({'channel': channel, 'data': data})
+            message = _pack_bus({'channel': channel, 'data': data})
+
+            # Server process: hand off to the batching flusher
+            if self.flusher_task and not self.flusher_task.done():
+                self._publish_queue.put_nowait((channel, data, message))
+                return True
+
+            # No flusher (e.g. CLI context): publish directly
             await self.redis_client.publish('ws:broadcast', message)
             return True
         except Exception as e:
@@ -138,10 +270,7 @@ class WebSocketManager:
             self.connections[user_id] = set()
 
         self.connections[user_id].add(ws)
-
-        # Start Redis subscriber on first connection (for multi-process support)
-        if len(self.connections) == 1:
-            await self._start_redis_subscriber()
+        self._all_sockets.add(ws)
 
         try:
             # Keep connection alive and handle messages
@@ -163,7 +292,7 @@ class WebSocketManager:
             message: Raw message string
         """
         try:
-            data = json.loads(message)
+            data = _loads(message)
             action = data.get("action")
 
             if action == "ping":
@@ -171,7 +300,7 @@ class WebSocketManager:
                 await self._send_to_websocket(
                     ws,
                     "pong",
-                    {"timestamp": datetime.utcnow().isoformat()}
+                    {"ts": time.time_ns() // 1_000_000}
                 )
             elif action == "subscribe":
                 # Handle channel subscription
@@ -203,6 +332,7 @@ class WebSocketManager:
             user_id: User ID
             ws: WebSocket connection
         """
+        self._all_sockets.discard(ws)
         if user_id in self.connections:
             self.connections[user_id].discard(ws)
             if not self.connections[user_id]:
@@ -217,13 +347,37 @@ class WebSocketManager:
             channel: Message channel
             data: Message data
         """
+        await self._send_raw(ws, self._build_message(channel, data))
+
+    def _build_message(self, channel: str, data: Any) -> str:
+        """
+        Serialize a message frame (built once and reused when broadcasting)
+
+        Args:
+            channel: Message channel
+            data: Message data
+
+        Returns:
+            JSON text frame
+        """
+        message = _dumps({
+            "channel": channel,
+            "data": data,
+            "ts": time.time_ns() // 1_000_000
+        })
+        # Decoded so clients keep receiving text frames
+        return message.decode('utf-8')
+
+    async def _send_raw(self, ws, payload: str):
+        """
+        Send an already serialized frame to a WebSocket
+
+        Args:
+            ws: WebSocket connection
+            payload: Serialized message
+        """
         try:
-            message = json.dumps({
-                "channel": channel,
-                "data": data,
-                "timestamp": datetime.utcnow().isoformat()
-            })
-            await ws.send(message)
+            await ws.send(payload)
         except Exception:
             # Connection might be closed
             pass
@@ -237,20 +391,13 @@ class WebSocketManager:
             channel: Message channel
             data: Message data
         """
-        if user_id not in self.connections:
+        # Snapshot the user's sockets; closed ones are cleaned up by _disconnect
+        sockets = tuple(self.connections.get(user_id, ()))
+        if not sockets:
             return
 
-        dead_connections = set()
-
-        for ws in self.connections[user_id].copy():
-            try:
-                await self._send_to_websocket(ws, channel, data)
-            except Exception:
-                dead_connections.add(ws)
-
-        # Clean up dead connections
-        for ws in dead_connections:
-            self.connections[user_id].discard(ws)
+        payload = self._build_message(channel, data)
+        await asyncio.gather(*(self._send_raw(ws, payload) for ws in sockets), return_exceptions=True)
 
     async def broadcast_to_all(self, channel: str, data: Any):
         """
@@ -261,10 +408,10 @@ class WebSocketManager:
             data: Message data
         """
         print(f"Broadcasting to {len(self.connections)} users")
-        tasks = []
 
-        for user_id in self.connections:
-            tasks.append(self.broadcast_to_user(user_id, channel, data))
+        # Serialize once, send the same frame to every socket
+        payload = self._build_message(channel, data)
+        tasks = [self._send_raw(ws, payload) for ws in self._all_sockets]
 
         if tasks:
             await asyncio.gather(*tasks, return_exceptions=True)